@@ -106,7 +106,7 @@ logger -t fgmod-uninstaller "Uninstalling from: $exe_folder_path"
 # === Remove OptiScaler Files ===
 echo " Removing OptiScaler files..."
 rm -f "OptiScaler.dll" "dxgi.dll" "winmm.dll" "dbghelp.dll" "version.dll" "wininet.dll" "winhttp.dll" "OptiScaler.asi"
-rm -f "OptiScaler.ini" "OptiScaler.log"
+rm -f "OptiScaler.ini" "OptiScaler.log" ".fgmod-launch-stamp" ".fgmod-ini-env-names"
 
 # === Remove Nukem FG Mod Files ===
 echo " Removing Nukem FG Mod files..."
@@ -19,7 +19,6 @@ fgmod_path="$HOME/fgmod"
 dll_name="${DLL:-dxgi.dll}"
 preserve_ini="${PRESERVE_INI:-true}"
 fsr4_variant="${FGMOD_FSR4_VARIANT:-}"
-python_bin="$(command -v python3 || command -v python || true)"
 
 # === Resolve Game Path ===
 if [[ "$#" -lt 1 ]]; then
@@ -144,23 +143,12 @@ resolve_fsr4_variant() {
     return
   fi
 
-  local manifest_path="$fgmod_path/install-manifest.json"
-  if [[ -f "$manifest_path" && -n "$python_bin" ]]; then
-    local manifest_variant
-    manifest_variant=$("$python_bin" - <<PY 2>/dev/null
-import json
-from pathlib import Path
-path = Path(r'''$manifest_path''')
-try:
-    data = json.loads(path.read_text(encoding='utf-8'))
-    value = str(data.get('selected_default_variant') or '').strip()
-    print(value)
-except Exception:
-    pass
-PY
-)
-    if [[ -n "$manifest_variant" ]]; then
-      echo "$manifest_variant"
+  # Read the manifest with bash builtins only; this runs on every launch
+  local manifest_path="$fgmod_path/install-manifest.json" manifest_content=""
+  if [[ -f "$manifest_path" ]]; then
+    IFS= read -r -d '' manifest_content < "$manifest_path" || true
+    if [[ "$manifest_content" =~ \"selected_default_variant\"[[:space:]]*:[[:space:]]*\"([^\"]+)\" ]]; then
+      echo "${BASH_REMATCH[1]}"
       return
     fi
   fi
@@ -217,6 +205,209 @@ is_managed_support_file() {
   [[ -f "$candidate" && -f "$existing_file" ]] && cmp -s "$existing_file" "$candidate"
 }
 
+support_files=(
+  "libxess.dll"
+  "libxess_dx11.dll"
+  "libxess_fg.dll"
+  "libxell.dll"
+  "amd_fidelityfx_dx12.dll"
+  "amd_fidelityfx_framegeneration_dx12.dll"
+  "amd_fidelityfx_vk.dll"
+  "dlssg_to_fsr3_amd_is_better.dll"
+  "fakenvapi.dll"
+  "fakenvapi.ini"
+)
+
+if [[ -f "$fgmod_path/renames/$dll_name" ]]; then
+  injector_src="$fgmod_path/renames/$dll_name"
+else
+  injector_src="$fgmod_path/OptiScaler.dll"
+fi
+
+# Bundle file that will be deployed as the given game-dir filename (empty if none)
+planned_source() {
+  local filename="$1" candidate
+  if [[ "$filename" == "$dll_name" ]]; then
+    echo "$injector_src"
+  elif [[ "$filename" == "amd_fidelityfx_upscaler_dx12.dll" ]]; then
+    echo "$fsr4_upscaler_src"
+  else
+    for candidate in "${variant_extra_files[@]}"; do
+      [[ "$filename" == "$candidate" ]] && { echo "$variant_dir/$candidate"; return; }
+    done
+    for candidate in "${support_files[@]}"; do
+      [[ "$filename" == "$candidate" ]] && { echo "$fgmod_path/$candidate"; return; }
+    done
+  fi
+}
+
+# True when the game dir already holds exactly what would be deployed under this name
+is_deployed_current() {
+  local source
+  source="$(planned_source "$1")"
+  [[ -n "$source" && -f "$source" && -f "$exe_folder_path/$1" ]] && cmp -s "$source" "$exe_folder_path/$1"
+}
+
+# Copy only when the content differs. Files are replaced rather than overwritten in place:
+# the plugin may have deployed them as hardlinks into ~/fgmod, and writing through such a
+# link would modify the shared bundle.
+deploy_file() {
+  local source="$1" dest="$2"
+  [[ -f "$source" ]] || return 1
+  cmp -s "$source" "$dest" 2>/dev/null && return 0
+  cp -f --reflink=auto --remove-destination "$source" "$dest"
+}
+
+deploy_tree() {
+  local source_dir="$1" dest_dir="$2" file relative
+  while IFS= read -r -d '' file; do
+    relative="${file#"$source_dir"/}"
+    mkdir -p "$dest_dir/$(dirname "$relative")"
+    deploy_file "$file" "$dest_dir/$relative" || true
+  done < <(find "$source_dir" -type f -print0)
+}
+
+# === Execute original command ===
+run_original_command() {
+  if [[ $# -gt 1 ]]; then
+    # Log to both file and system journal
+    logger -t fgmod "=================="
+    logger -t fgmod "Debug Info (Launch Mode):"
+    logger -t fgmod "Number of arguments: $#"
+    for i in $(seq 1 $#); do
+      logger -t fgmod "Arg $i: ${!i}"
+    done
+    logger -t fgmod "Final executable path: $exe_folder_path"
+    logger -t fgmod "=================="
+  
+    # Execute the original command
+    export SteamDeck=0
+    # Build WINEDLLOVERRIDES from the actual proxy DLL name (strip extension to get the stem)
+    if [[ "$dll_name" == *.dll ]]; then
+      _wine_dll="${dll_name%.dll}"
+      export WINEDLLOVERRIDES="$WINEDLLOVERRIDES,${_wine_dll}=n,b"
+      unset _wine_dll
+    fi
+    # .asi files are loaded by an ASI loader — no WINEDLLOVERRIDES entry needed
+
+    # Filter out leading -- separators (from Steam launch options)
+    while [[ $# -gt 0 && "$1" == "--" ]]; do
+      shift
+    done
+
+    exec >/dev/null 2>&1
+    "$@"
+  else
+    echo "Done!"
+    echo "----------------------------------------"
+    echo "Debug Info (Standalone Mode):"
+    echo "Number of arguments: $#"
+    for i in $(seq 1 $#); do
+      echo "Arg $i: ${!i}"
+    done
+    echo "Final executable path: $exe_folder_path"
+    echo "----------------------------------------"
+  
+    # Also log standalone mode to journal
+    logger -t fgmod "=================="
+    logger -t fgmod "Debug Info (Standalone Mode):"
+    logger -t fgmod "Number of arguments: $#"
+    for i in $(seq 1 $#); do
+      logger -t fgmod "Arg $i: ${!i}"
+    done
+    logger -t fgmod "Final executable path: $exe_folder_path"
+    logger -t fgmod "=================="
+  fi
+}
+
+# === Launch Stamp ===
+# Records what the last successful launch deployed. When the bundle, the selected
+# variant, the proxy name, the env vars the INI updater can act on and the stat
+# signature of every deployed file are unchanged, the copy/backup/INI steps below
+# are skipped and the game starts immediately. Validation is stat-only: a file
+# rewritten in place with the same size and timestamps is not detected.
+launch_stamp="$exe_folder_path/.fgmod-launch-stamp"
+fgmod_version=""
+[[ -f "$fgmod_path/version.txt" ]] && read -r fgmod_version < "$fgmod_path/version.txt"
+
+# NAME=value for the env vars that can change the deployed INI: OptiScaler_* and the
+# names listed in ini-env-names.txt (the updater's own filter), plus this script's inputs
+launch_stamp_env() {
+  local env_names="$fgmod_path/ini-env-names.txt" name
+  if [[ ! -f "$env_names" ]]; then
+    env | grep -v -E '^(_|SHLVL|PWD|OLDPWD)='
+    return
+  fi
+  # The updater lists the names of a game INI that differs from the bundled one next to it
+  local name_lists=(-f "$env_names")
+  [[ -f "$exe_folder_path/.fgmod-ini-env-names" ]] && name_lists+=(-f "$exe_folder_path/.fgmod-ini-env-names")
+  {
+    compgen -e | grep -E '^(OptiScaler_.*|DLL|PRESERVE_INI|FGMOD_FSR4_VARIANT)$'
+    compgen -e | grep -F -x "${name_lists[@]}"
+  } | LC_ALL=C sort -u | while IFS= read -r name; do
+    printf '%s=%s\0' "$name" "${!name}"
+  done
+}
+
+launch_stamp_key() {
+  local env_digest
+  env_digest=$(launch_stamp_env | cksum)
+  echo "key=$fgmod_version|$selected_fsr4_variant|$dll_name|$preserve_ini|${env_digest%% *}"
+}
+
+# device:inode:size:mtime:ctime for the manifest, the INI and the given game-dir files
+launch_stamp_signature() {
+  echo "stat=$(cd "$exe_folder_path" && stat -L -c '%d:%i:%s:%Y:%Z' "$fgmod_path/install-manifest.json" OptiScaler.ini "$@" 2>/dev/null | tr '\n' ' ')"
+}
+
+launch_stamp_current() {
+  [[ -f "$launch_stamp" ]] || return 1
+  local stamp_key stamp_signature file
+  local -a stamp_files=()
+  {
+    IFS= read -r stamp_key
+    IFS= read -r stamp_signature
+    while IFS= read -r file; do
+      [[ -n "$file" ]] && stamp_files+=("$file")
+    done
+  } < "$launch_stamp"
+  [[ ${#stamp_files[@]} -gt 0 ]] || return 1
+  [[ "$stamp_key" == "$(launch_stamp_key)" ]] || return 1
+  [[ "$stamp_signature" == "$(launch_stamp_signature "${stamp_files[@]}")" ]]
+}
+
+write_launch_stamp() {
+  local -a files=()
+  local file tree
+  for file in "$dll_name" "${support_files[@]}" "amd_fidelityfx_upscaler_dx12.dll" "${variant_extra_files[@]}"; do
+    [[ -f "$exe_folder_path/$file" ]] && files+=("$file")
+  done
+  for tree in plugins D3D12_Optiscaler; do
+    [[ -d "$exe_folder_path/$tree" ]] || continue
+    while IFS= read -r -d '' file; do
+      files+=("$file")
+    done < <(cd "$exe_folder_path" && find "$tree" -type f -print0)
+  done
+  {
+    launch_stamp_key
+    launch_stamp_signature "${files[@]}"
+    printf '%s\n' "${files[@]}"
+  } > "$launch_stamp.tmp" && mv -f "$launch_stamp.tmp" "$launch_stamp" || rm -f "$launch_stamp.tmp"
+}
+
+if launch_stamp_current; then
+  echo " Launch stamp matches; game directory is already up to date"
+  logger -t fgmod "Launch stamp current for $exe_folder_path, skipping deployment"
+  run_original_command "$@"
+  exit
+fi
+rm -f "$launch_stamp"
+
+# Files matching the bundle are only ours to leave in place once the directory was patched before;
+# on a first patch an identical DLL still belongs to the game and gets the usual backup
+already_patched=0
+has_patch_fingerprint && already_patched=1
+
 # === Backup Pre-existing Proxy DLLs Before Cleanup ===
 for dll in "${proxy_backup_files[@]}"; do
   existing_path="$exe_folder_path/$dll"
@@ -235,6 +426,7 @@ unset existing_path backup_path fingerprint
 
 # === Cleanup Old Injectors / Legacy OptiScaler Artifacts ===
 for cleanup_file in "${cleanup_files[@]}"; do
+  (( already_patched )) && is_deployed_current "$cleanup_file" && continue
   rm -f "$exe_folder_path/$cleanup_file"
 done
 unset cleanup_file
@@ -245,7 +437,9 @@ for dll in "${original_dlls[@]}"; do
   existing_path="$exe_folder_path/$dll"
   backup_path="$exe_folder_path/$dll.b"
   if [[ -f "$existing_path" && ! -f "$backup_path" ]]; then
-    if has_patch_fingerprint && is_managed_support_file "$existing_path"; then
+    if (( already_patched )) && is_deployed_current "$dll"; then
+      continue
+    elif has_patch_fingerprint && is_managed_support_file "$existing_path"; then
       rm -f "$existing_path"
       logger -t fgmod "Removed managed support file before repatch: $dll"
     else
@@ -263,10 +457,10 @@ echo " Cleaned up nvapi64.dll and backup (legacy fakenvapi conflicts)"
 # === Core Install ===
 if [[ -f "$fgmod_path/renames/$dll_name" ]]; then
   echo " Using pre-renamed $dll_name"
-  cp "$fgmod_path/renames/$dll_name" "$exe_folder_path/$dll_name" || error_exit " Failed to copy $dll_name"
+  deploy_file "$injector_src" "$exe_folder_path/$dll_name" || error_exit " Failed to copy $dll_name"
 else
   echo " Pre-renamed $dll_name not found, falling back to OptiScaler.dll"
-  cp "$fgmod_path/OptiScaler.dll" "$exe_folder_path/$dll_name" || error_exit " Failed to copy OptiScaler.dll as $dll_name"
+  deploy_file "$injector_src" "$exe_folder_path/$dll_name" || error_exit " Failed to copy OptiScaler.dll as $dll_name"
 fi
 
 # === OptiScaler.ini Handling ===
@@ -275,42 +469,21 @@ if [[ "$preserve_ini" == "true" && -f "$exe_folder_path/OptiScaler.ini" ]]; then
   logger -t fgmod "Existing OptiScaler.ini preserved in $exe_folder_path"
 else
   echo " Installing OptiScaler.ini from plugin defaults"
-  cp "$fgmod_path/OptiScaler.ini" "$exe_folder_path/OptiScaler.ini" || error_exit " Failed to copy OptiScaler.ini"
+  cp --reflink=auto --remove-destination "$fgmod_path/OptiScaler.ini" "$exe_folder_path/OptiScaler.ini" || error_exit " Failed to copy OptiScaler.ini"
   logger -t fgmod "OptiScaler.ini installed to $exe_folder_path"
 fi
 
-# === OptiScaler env variables Handling ===
+# === OptiScaler.ini rules and env variables Handling ===
+# Applies the plugin's launch rules from ini-rules.json (FGType -> FGInput/FGOutput
+# migration, UseHQFont=auto -> false) and then any env overrides, in one pass
 if [[ -f "$fgmod_path/update-optiscaler-config.py" ]]; then
   python "$fgmod_path/update-optiscaler-config.py" "$exe_folder_path/OptiScaler.ini"
 fi
 
-# OptiScaler 0.9.0-pre11 can assert on Proton when HQ font auto mode tries to load
-# an external TTF that is not present. Only normalize the default auto value.
-sed -i 's/^UseHQFont[[:space:]]*=[[:space:]]*auto$/UseHQFont=false/' "$exe_folder_path/OptiScaler.ini" || true
-
-# === Migrate FGType → FGInput/FGOutput (pre-v0.9-final INIs) ===
-# v0.9-final split the single FGType key into FGInput + FGOutput. Games that were
-# patched with an older build will have FGType=<value> with no FGInput/FGOutput,
-# causing the new DLL to silently use nofg. Fix that here on every launch.
-_fgtype_ini="$exe_folder_path/OptiScaler.ini"
-if grep -q '^FGType=' "$_fgtype_ini" 2>/dev/null; then
-  _fgtype_val=$(sed -n 's/^FGType=\(.*\)/\1/p' "$_fgtype_ini")
-  echo " Migrating FGType=$_fgtype_val → FGInput/FGOutput in OptiScaler.ini"
-  logger -t fgmod "Migrating FGType=$_fgtype_val → FGInput/FGOutput"
-  if grep -q '^FGInput=' "$_fgtype_ini"; then
-    # FGInput already present — INI already in v0.9-final format; just drop FGType
-    sed -i '/^FGType=/d' "$_fgtype_ini" || true
-  else
-    # Replace FGType=X with FGInput=X + FGOutput=X
-    sed -i "s/^FGType=.*$/FGInput=$_fgtype_val\nFGOutput=$_fgtype_val/" "$_fgtype_ini" || true
-  fi
-fi
-unset _fgtype_ini _fgtype_val
-
 # === ASI Plugins Directory ===
 if [[ -d "$fgmod_path/plugins" ]]; then
   echo " Installing ASI plugins directory"
-  cp -r "$fgmod_path/plugins" "$exe_folder_path/" || true
+  deploy_tree "$fgmod_path/plugins" "$exe_folder_path/plugins"
   logger -t fgmod "ASI plugins directory installed to $exe_folder_path"
 else
   echo " No plugins directory found in fgmod"
@@ -319,29 +492,29 @@ fi
 # === D3D12_Optiscaler Directory (required for FSR4/FidelityFX DX12 path) ===
 if [[ -d "$fgmod_path/D3D12_Optiscaler" ]]; then
   echo " Installing D3D12_Optiscaler directory"
-  cp -r "$fgmod_path/D3D12_Optiscaler" "$exe_folder_path/" || true
+  deploy_tree "$fgmod_path/D3D12_Optiscaler" "$exe_folder_path/D3D12_Optiscaler"
   logger -t fgmod "D3D12_Optiscaler directory installed to $exe_folder_path"
 else
   echo " No D3D12_Optiscaler directory found in fgmod"
 fi
 
 # === Supporting Libraries ===
-cp -f "$fgmod_path/libxess.dll" "$exe_folder_path/" || true
-cp -f "$fgmod_path/libxess_dx11.dll" "$exe_folder_path/" || true
-cp -f "$fgmod_path/libxess_fg.dll" "$exe_folder_path/" || true
-cp -f "$fgmod_path/libxell.dll" "$exe_folder_path/" || true
-cp -f "$fgmod_path/amd_fidelityfx_dx12.dll" "$exe_folder_path/" || true
-cp -f "$fgmod_path/amd_fidelityfx_framegeneration_dx12.dll" "$exe_folder_path/" || true
-cp -f "$fsr4_upscaler_src" "$exe_folder_path/amd_fidelityfx_upscaler_dx12.dll" || true
-cp -f "$fgmod_path/amd_fidelityfx_vk.dll" "$exe_folder_path/" || true
+deploy_file "$fgmod_path/libxess.dll" "$exe_folder_path/libxess.dll" || true
+deploy_file "$fgmod_path/libxess_dx11.dll" "$exe_folder_path/libxess_dx11.dll" || true
+deploy_file "$fgmod_path/libxess_fg.dll" "$exe_folder_path/libxess_fg.dll" || true
+deploy_file "$fgmod_path/libxell.dll" "$exe_folder_path/libxell.dll" || true
+deploy_file "$fgmod_path/amd_fidelityfx_dx12.dll" "$exe_folder_path/amd_fidelityfx_dx12.dll" || true
+deploy_file "$fgmod_path/amd_fidelityfx_framegeneration_dx12.dll" "$exe_folder_path/amd_fidelityfx_framegeneration_dx12.dll" || true
+deploy_file "$fsr4_upscaler_src" "$exe_folder_path/amd_fidelityfx_upscaler_dx12.dll" || true
+deploy_file "$fgmod_path/amd_fidelityfx_vk.dll" "$exe_folder_path/amd_fidelityfx_vk.dll" || true
 for extra_file in "${variant_extra_files[@]}"; do
   if [[ -f "$variant_dir/$extra_file" ]]; then
-    cp -f "$variant_dir/$extra_file" "$exe_folder_path/" || true
+    deploy_file "$variant_dir/$extra_file" "$exe_folder_path/$extra_file" || true
   fi
 done
 
 # === Nukem FG Mod Files (now in fgmod directory) ===
-cp -f "$fgmod_path/dlssg_to_fsr3_amd_is_better.dll" "$exe_folder_path/" || true
+deploy_file "$fgmod_path/dlssg_to_fsr3_amd_is_better.dll" "$exe_folder_path/dlssg_to_fsr3_amd_is_better.dll" || true
 # Note: dlssg_to_fsr3.ini is not included in v0.9.0-final archive
 
 # === FakeNVAPI Files ===
@@ -350,8 +523,8 @@ cp -f "$fgmod_path/dlssg_to_fsr3_amd_is_better.dll" "$exe_folder_path/" || true
 # echo " Removed legacy nvapi64.dll"
 
 # Copy fakenvapi.dll with original name (v1.3.8.1) 
-cp -f "$fgmod_path/fakenvapi.dll" "$exe_folder_path/" || true
-cp -f "$fgmod_path/fakenvapi.ini" "$exe_folder_path/" || true
+deploy_file "$fgmod_path/fakenvapi.dll" "$exe_folder_path/fakenvapi.dll" || true
+deploy_file "$fgmod_path/fakenvapi.ini" "$exe_folder_path/fakenvapi.ini" || true
 echo " Installed fakenvapi.dll and fakenvapi.ini"
 
 # === Additional Support Files ===
@@ -363,54 +536,6 @@ echo " Installation completed successfully!"
 echo " For Steam, add this to the launch options: \"$fgmod_path/fgmod\" %COMMAND%"
 echo " For Heroic, add this as a new wrapper: \"$fgmod_path/fgmod\""
 logger -t fgmod "Installation completed successfully for $exe_folder_path"
+write_launch_stamp
 
-# === Execute original command ===
-if [[ $# -gt 1 ]]; then
-  # Log to both file and system journal
-  logger -t fgmod "=================="
-  logger -t fgmod "Debug Info (Launch Mode):"
-  logger -t fgmod "Number of arguments: $#"
-  for i in $(seq 1 $#); do
-    logger -t fgmod "Arg $i: ${!i}"
-  done
-  logger -t fgmod "Final executable path: $exe_folder_path"
-  logger -t fgmod "=================="
-  
-  # Execute the original command
-  export SteamDeck=0
-  # Build WINEDLLOVERRIDES from the actual proxy DLL name (strip extension to get the stem)
-  if [[ "$dll_name" == *.dll ]]; then
-    _wine_dll="${dll_name%.dll}"
-    export WINEDLLOVERRIDES="$WINEDLLOVERRIDES,${_wine_dll}=n,b"
-    unset _wine_dll
-  fi
-  # .asi files are loaded by an ASI loader — no WINEDLLOVERRIDES entry needed
-
-  # Filter out leading -- separators (from Steam launch options)
-  while [[ $# -gt 0 && "$1" == "--" ]]; do
-    shift
-  done
-
-  exec >/dev/null 2>&1
-  "$@"
-else
-  echo "Done!"
-  echo "----------------------------------------"
-  echo "Debug Info (Standalone Mode):"
-  echo "Number of arguments: $#"
-  for i in $(seq 1 $#); do
-    echo "Arg $i: ${!i}"
-  done
-  echo "Final executable path: $exe_folder_path"
-  echo "----------------------------------------"
-  
-  # Also log standalone mode to journal
-  logger -t fgmod "=================="
-  logger -t fgmod "Debug Info (Standalone Mode):"
-  logger -t fgmod "Number of arguments: $#"
-  for i in $(seq 1 $#); do
-    logger -t fgmod "Arg $i: ${!i}"
-  done
-  logger -t fgmod "Final executable path: $exe_folder_path"
-  logger -t fgmod "=================="
-fi
+run_original_command "$@"
@@ -0,0 +1,197 @@
+"""OptiScaler.ini engine shared by the plugin backend and the launch-time updater.
+
+The plugin imports this module from its assets directory and installs a copy next to
+update-optiscaler-config.py in ~/fgmod, so install, patch and launch parse the INI and
+apply OPTISCALER_INI_RULES with the same code.
+"""
+import json
+import os
+import tempfile
+
+SECTION_PREFIX_VAR = "OptiScaler_"
+
+
+def normalize_section(section_name):
+    # Strip - and . so V-Sync becomes VSync
+    # This allows env vars like VSync_Key to match INI section [V-Sync]
+    return section_name.replace('-', '').replace('.', '')
+
+
+def read_ini(file_path):
+    # newline='' keeps CRLF files byte-identical; surrogateescape round-trips any stray bytes
+    with open(file_path, 'r', encoding='utf-8', errors='surrogateescape', newline='') as f:
+        return f.readlines()
+
+
+def write_atomic(file_path, lines):
+    """Replace file_path with lines via a temp file in the same directory, keeping its mode."""
+    file_path = os.fspath(file_path)
+    directory = os.path.dirname(os.path.abspath(file_path))
+    try:
+        mode = os.stat(file_path).st_mode & 0o7777
+    except FileNotFoundError:
+        mode = 0o644
+    fd, tmp_path = tempfile.mkstemp(prefix='.' + os.path.basename(file_path) + '.', dir=directory)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8', errors='surrogateescape', newline='') as f:
+            f.writelines(lines)
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def index_ini(lines):
+    """Map every section to {key: line index} in one pass over the file.
+
+    Only the first [Section] header and the first Key= line inside it count.
+    """
+    sections = {}
+    current = None
+    for i, line in enumerate(lines):
+        stripped = line.strip()
+        if not stripped or stripped[0] in ';#':
+            continue
+        if stripped.startswith('['):
+            end = stripped.find(']')
+            name = stripped[1:end] if end > 0 else None
+            # A repeated header does not reopen the section for lookups
+            current = name if name is not None and name not in sections else None
+            if current is not None:
+                sections[current] = {}
+            continue
+        if current is None or '=' not in line:
+            continue
+        key = line.split('=', 1)[0].strip()
+        if key:
+            sections[current].setdefault(key, i)
+    return sections
+
+
+def line_with_value(line, value):
+    """Replace the value of a Key=Value line, keeping the key, its spacing and the line ending."""
+    body = line.rstrip('\r\n')
+    return body.split('=', 1)[0] + '=' + value + line[len(body):]
+
+
+def apply_rules(lines, rules, stage):
+    """Apply the rules for stage to lines in place; returns a description per edit.
+
+    Rules are idempotent, so re-running a stage over an already transformed INI changes nothing.
+    """
+    changes = []
+    sections = index_ini(lines)
+    for rule in rules:
+        if stage not in rule.get('stages', ()):
+            continue
+        restructured = False
+        for section, keys in sections.items():
+            index = keys.get(rule['key'])
+            if index is None:
+                continue
+            line = lines[index]
+            body = line.rstrip('\r\n')
+            ending = line[len(body):]
+            value = body.split('=', 1)[1].strip()
+            if rule['action'] == 'replace_value':
+                if value == rule['from']:
+                    lines[index] = line_with_value(line, rule['to'])
+                    changes.append(f"[{section}] {rule['key']}={rule['to']}")
+            elif rule['action'] == 'split_key':
+                if rule['into'][0] in keys:
+                    # Already in the new format; the old key is only noise
+                    lines[index] = ''
+                    changes.append(f"[{section}] removed stale {rule['key']}")
+                else:
+                    separator = ending or '\n'
+                    lines[index] = separator.join(f"{key}={value}" for key in rule['into']) + ending
+                    changes.append(f"[{section}] {rule['key']}={value} -> {', '.join(rule['into'])}")
+                restructured = True
+        if restructured:
+            lines[:] = ''.join(lines).splitlines(keepends=True)
+            sections = index_ini(lines)
+    return changes
+
+
+def build_key_index(sections, schema_version):
+    """Summarize which env var names can address an INI with these sections."""
+    key_sections = {}
+    for section, keys in sections.items():
+        for key in keys:
+            key_sections.setdefault(key, []).append(section)
+    return {
+        'schema_version': schema_version,
+        'sections': {section: sorted(keys) for section, keys in sections.items()},
+        # Env var names cannot contain - or ., so [V-Sync] is addressed as VSync_Key
+        'normalized_sections': {normalize_section(section): section for section in sections},
+        'unique_keys': {key: found[0] for key, found in sorted(key_sections.items()) if len(found) == 1},
+        'ambiguous_keys': sorted(key for key, found in key_sections.items() if len(found) > 1),
+    }
+
+
+def addressable_env_names(key_index):
+    """Every env var name besides OptiScaler_* that collect_env_updates can map to a key.
+
+    That is each unique bare key, plus Section_Key for every exact or normalized section name.
+    A name splits at its first underscore, so sections containing one are never addressable.
+    """
+    sections = key_index['sections']
+    names = set(key_index['unique_keys'])
+    aliases = [(section, section) for section in sections]
+    aliases.extend(key_index['normalized_sections'].items())
+    for alias, section in aliases:
+        if '_' not in alias and section in sections:
+            names.update(f"{alias}_{key}" for key in sections[section])
+    return names - set(key_index['ambiguous_keys'])
+
+
+def prepare_key_index(index):
+    """Turn a build_key_index result (or its JSON form) into the set-based lookup form."""
+    key_index = {
+        'sections': {section: set(keys) for section, keys in index['sections'].items()},
+        'normalized_sections': index['normalized_sections'],
+        'unique_keys': index['unique_keys'],
+        'ambiguous_keys': set(index['ambiguous_keys']),
+    }
+    key_index['env_names'] = addressable_env_names(key_index)
+    return key_index
+
+
+def load_key_index(index_path):
+    try:
+        with open(index_path, 'r', encoding='utf-8') as f:
+            return prepare_key_index(json.load(f))
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return None
+
+
+def key_index_for_ini(key_index, sections):
+    """Return the key index that matches a game's INI, and whether it had to be built from that INI.
+
+    The bundled index only describes the INI we ship. A game's copy from another OptiScaler build
+    can have extra sections or keys, or a key that is unique in one file and repeated in the other,
+    so anything but an exact match is indexed from the game's own sections instead.
+    """
+    if key_index is None:
+        return None, False
+    if key_index['sections'] == {section: set(keys) for section, keys in sections.items()}:
+        return key_index, False
+    return prepare_key_index(build_key_index(sections, None)), True
+
+
+def relevant_env(environ, key_index):
+    """Split environ into env vars that can name an OptiScaler.ini key and ambiguous bare key names.
+
+    Everything else costs one set lookup. Without an index the whole environment is relevant.
+    """
+    if key_index is None:
+        return dict(environ), []
+    relevant = {}
+    ambiguous = []
+    for env_name, env_value in environ.items():
+        if env_name.startswith(SECTION_PREFIX_VAR) or env_name in key_index['env_names']:
+            relevant[env_name] = env_value
+        elif env_name in key_index['ambiguous_keys']:
+            ambiguous.append(env_name)
+    return relevant, ambiguous
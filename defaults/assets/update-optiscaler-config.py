@@ -1,110 +1,159 @@
+import json
 import os
 import sys
-import re
-from configparser import ConfigParser
-
-def update_optiscaler_config(file_path):
-    if not os.path.exists(file_path):
-        print(f"Error: File '{file_path}' not found.")
-        return
-
-    with open(file_path, 'r') as f:
-        lines = f.readlines()
-
-    config = ConfigParser()
-    config.optionxform = str  # Preserve case for keys (otherwise PATH could match Path)
-    config.read(file_path)
 
+# optiscaler_ini is installed next to this script in ~/fgmod
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from optiscaler_ini import (  # noqa: E402
+    SECTION_PREFIX_VAR,
+    apply_rules,
+    index_ini,
+    key_index_for_ini,
+    line_with_value,
+    load_key_index,
+    normalize_section,
+    read_ini,
+    relevant_env,
+    write_atomic,
+)
+
+# Written into ~/fgmod by the plugin from the same rules it applies at install and patch time
+RULES_FILENAME = "ini-rules.json"
+RULES_STAGE = "launch"
+# Sections and keys of the bundled default INI, precomputed by the plugin at install time
+KEY_INDEX_FILENAME = "ini-key-index.json"
+# Env var names of a game INI that differs from the bundled one, written next to it for fgmod.sh's launch stamp
+GAME_ENV_NAMES_FILENAME = ".fgmod-ini-env-names"
+
+
+def load_rules(rules_path):
+    try:
+        with open(rules_path, 'r', encoding='utf-8') as f:
+            rules = json.load(f).get('rules')
+    except (OSError, ValueError, AttributeError) as e:
+        print(f"No INI rules applied ({rules_path}: {e})")
+        return []
+    return rules if isinstance(rules, list) else []
+
+
+def collect_env_updates(sections, environ):
+    """Resolve environment variables to {(section, key): (value, env_name)}; later matches win."""
     # Because we want to support unprefixed env variables, we need to count key occurrences across all sections of the ini file
     # Keys that appear multiple times should be prefixed like Section_Key by the user for them to be targeted properly
-
-    # Normalize section names: strip - and . so V-Sync becomes VSync
-    # This allows env vars like VSync_Key to match INI section [V-Sync]
-    def normalize_section(section_name):
-        return section_name.replace('-', '').replace('.', '')
-
-    key_occurrences = {}
     key_to_sections = {}
-    section_normalized_to_actual = {}  # Maps normalized section name to actual section name
+    section_normalized_to_actual = {}
+    for section, keys in sections.items():
+        section_normalized_to_actual[normalize_section(section)] = section
+        for key in keys:
+            key_to_sections.setdefault(key, []).append(section)
 
-    for section in config.sections():
-        normalized = normalize_section(section)
-        section_normalized_to_actual[normalized] = section
-
-        for key in config.options(section):
-            key_occurrences[key] = key_occurrences.get(key, 0) + 1
-            if key not in key_to_sections:
-                key_to_sections[key] = []
-            key_to_sections[key].append(section)
-
-    env_updates = []
+    updates = {}
 
     # Handle OptiScaler_Section_Key format
-    optiscaler_vars = {k: v for k, v in os.environ.items() if k.startswith("OptiScaler_")}
-    for env_name, env_value in optiscaler_vars.items():
+    for env_name, env_value in environ.items():
+        if not env_name.startswith(SECTION_PREFIX_VAR):
+            continue
         parts = env_name.split('_', 2)
         if len(parts) >= 3:
-            env_updates.append(('optiscaler', parts[1], parts[2], env_value, env_name))
+            updates[(parts[1], parts[2])] = (env_value, env_name)
 
     # Handle Section_Key and Key formats
-    other_vars = {k: v for k, v in os.environ.items() if not k.startswith("OptiScaler_")}
-    for env_name, env_value in other_vars.items():
+    for env_name, env_value in environ.items():
+        if env_name.startswith(SECTION_PREFIX_VAR):
+            continue
         # Try Section_Key format
         if '_' in env_name:
-            parts = env_name.split('_', 1)
-            section_from_env = parts[0]
-            key = parts[1]
+            section_from_env, key = env_name.split('_', 1)
 
             # Try exact section match first
-            if config.has_section(section_from_env) and config.has_option(section_from_env, key):
-                env_updates.append(('section_key', section_from_env, key, env_value, env_name))
+            if key in sections.get(section_from_env, ()):
+                updates[(section_from_env, key)] = (env_value, env_name)
                 continue
 
             # Try section match with normalized section names
-            if section_from_env in section_normalized_to_actual:
-                actual_section = section_normalized_to_actual[section_from_env]
-                if config.has_option(actual_section, key):
-                    env_updates.append(('section_key', actual_section, key, env_value, env_name))
-                    continue
+            actual_section = section_normalized_to_actual.get(section_from_env)
+            if actual_section is not None and key in sections[actual_section]:
+                updates[(actual_section, key)] = (env_value, env_name)
+                continue
 
         # Try Key format (only if key appears exactly once across all sections)
-        if env_name in key_occurrences and key_occurrences[env_name] == 1:
-            section = key_to_sections[env_name][0]
-            env_updates.append(('key', section, env_name, env_value, env_name))
-
-    print(f"Found {len(env_updates)} updates to apply")
-    for entry in env_updates:
-        print(f"> {entry}")
-
-    for update_type, section_target, key_target, env_value, env_name in env_updates:
-        found_section = False
-
-        # Regex to match [Section] and Key=Value (case-sensitive)
-        section_pattern = re.compile(rf'^\s*\[{re.escape(section_target)}]\s*')
-        key_pattern = re.compile(rf'^(\s*{re.escape(key_target)}\s*)=.*')
-
-        for i, line in enumerate(lines):
-            # Track if we are inside the correct section
-            if section_pattern.match(line):
-                found_section = True
-                continue
+        matches = key_to_sections.get(env_name)
+        if matches and len(matches) == 1:
+            updates[(matches[0], env_name)] = (env_value, env_name)
+
+    return updates
+
+
+def apply_updates(lines, sections, updates):
+    """Rewrite the indexed Key= lines in place; returns whether any line changed."""
+    changed = False
+    for (section, key), (value, env_name) in updates.items():
+        index = sections.get(section, {}).get(key)
+        if index is None:
+            continue
+        line = lines[index]
+        new_line = line_with_value(line, value)
+        if new_line != line:
+            lines[index] = new_line
+            changed = True
+            print(f"Updated: [{section}] {key} = {value} (from {env_name})")
+    return changed
+
+
+def sync_game_env_names(directory, key_index, own_index):
+    """Keep the game's env name list in step: present only while its INI needed its own index."""
+    names_path = os.path.join(directory, GAME_ENV_NAMES_FILENAME)
+    if not own_index:
+        try:
+            os.remove(names_path)
+        except FileNotFoundError:
+            pass
+        return
+    names = [name + '\n' for name in sorted(key_index['env_names'])]
+    try:
+        with open(names_path, 'r', encoding='utf-8') as f:
+            if f.readlines() == names:
+                return
+    except OSError:
+        pass
+    write_atomic(names_path, names)
 
-            # If we hit a new section before finding the key, the key doesn't exist in the target section
-            if found_section and line.strip().startswith('[') and not section_pattern.match(line):
-                break
 
-            # Replace the value if the key is found within the correct section
-            if found_section and key_pattern.match(line):
-                lines[i] = key_pattern.sub(r'\1=' + env_value, line)
-                print(f"Updated: [{section_target}] {key_target} = {env_value} (from {env_name})")
-                break
+def update_optiscaler_config(file_path):
+    if not os.path.exists(file_path):
+        print(f"Error: File '{file_path}' not found.")
+        return
 
-    # Write the modified content back
-    with open(file_path, 'w') as f:
-        f.writelines(lines)
+    lines = read_ini(file_path)
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+
+    # The plugin's rules (FGType migration, HQ font) run first so env overrides always have the last word
+    rule_changes = apply_rules(lines, load_rules(os.path.join(script_dir, RULES_FILENAME)), RULES_STAGE)
+    for change in rule_changes:
+        print(f"Rule: {change}")
+    sections = index_ini(lines)
+
+    key_index, own_index = key_index_for_ini(load_key_index(os.path.join(script_dir, KEY_INDEX_FILENAME)), sections)
+    if own_index:
+        print("OptiScaler.ini differs from the bundled default, matching env vars against its own keys")
+    sync_game_env_names(os.path.dirname(os.path.abspath(file_path)), key_index, own_index)
+    environ, ambiguous = relevant_env(os.environ, key_index)
+    for env_name in ambiguous:
+        print(f"Ignoring {env_name}: key exists in several sections, use Section_{env_name}")
+    updates = collect_env_updates(sections, environ)
+
+    print(f"Found {len(updates)} updates to apply")
+    for (section, key), (value, env_name) in updates.items():
+        print(f"> ({section!r}, {key!r}, {value!r}, {env_name!r})")
+
+    env_changed = apply_updates(lines, sections, updates)
+    if rule_changes or env_changed:
+        write_atomic(file_path, lines)
+    else:
+        print("OptiScaler.ini already up to date")
 
 if __name__ == "__main__":
     if len(sys.argv) < 2:
         print("Usage: python update-optiscaler-config.py <path_to_ini>")
     else:
-        update_optiscaler_config(sys.argv[1])
\ No newline at end of file
+        update_optiscaler_config(sys.argv[1])
@@ -1,14 +1,30 @@
 import decky
 import os
+import asyncio
+import contextlib
+import contextvars
+import errno
+import functools
 import subprocess
 import json
 import shutil
 import re
-import filecmp
 import hashlib
+import ctypes
+import fcntl
+import stat
+import struct
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait as wait_futures
 from datetime import datetime, timezone
 from pathlib import Path
 
+# The OptiScaler.ini engine ships as an asset so fgmod's launch-time updater imports the same code
+sys.path.insert(0, os.path.join(decky.DECKY_PLUGIN_DIR, "assets"))
+import optiscaler_ini  # noqa: E402
+
 OPTISCALER_ARCHIVE_ASSET = {
     "name": "Optiscaler_0.9.3-final.20260618.7z",
     "sha256": "e3ac655d60ec11b471ac8cc5f4d3758e4bce9151c86caa339d8f0700c00282e3",
@@ -37,7 +53,93 @@ FSR4_UPSCALER_FILENAME = "amd_fidelityfx_upscaler_dx12.dll"
 FSR4_DRIVER_OVERRIDE_FILENAME = "amdxcffx64.dll"
 INSTALL_MANIFEST_FILENAME = "install-manifest.json"
 VERSION_FILENAME = "version.txt"
+HASH_CACHE_FILENAME = "hash-cache.json"
+HASH_CACHE_MAX_ENTRIES = 4096
+PATCHED_GAMES_FILENAME = "patched-games.json"
+BUNDLE_STAGING_DIRNAME = ".fgmod-staging"
+BUNDLE_PREVIOUS_DIRNAME = ".fgmod-previous"
+BUNDLE_OBJECTS_DIRNAME = "objects"
+# Payloads nothing writes to after deployment; safe to share an inode with the bundle
+READ_ONLY_PAYLOAD_SUFFIXES = {".dll", ".asi"}
+FICLONE = 0x40049409
+# Plugin state kept inside ~/fgmod that must survive a bundle rebuild
+BUNDLE_STATE_FILES = [HASH_CACHE_FILENAME, PATCHED_GAMES_FILENAME]
 DEFAULT_FSR4_VARIANT = "rdna23-int8"
+# Seconds a Steam library registry refresh stays valid before mtimes are re-checked
+GAME_REGISTRY_TTL_SECONDS = 2.0
+# Deadline for a library's manifest scan; past it the library's last-known games are served
+LIBRARY_SCAN_TIMEOUT_SECONDS = 1.5
+LIBRARY_SCAN_MAX_WORKERS = 4
+# Seconds a /proc process snapshot is reused by running-game checks
+PROCESS_SNAPSHOT_TTL_SECONDS = 1.0
+# Environment variables through which Steam tags every process it launches for a game
+STEAM_APPID_ENV_VARS = (b"SteamAppId", b"STEAM_COMPAT_APP_ID")
+# Steam/Proton helpers that carry a game's appid (and often its exe path) without being the game;
+# several of them outlive it by seconds to minutes
+LAUNCH_HELPER_PROCESSES = {
+    "wineserver",
+    "wine64-preloader",
+    "wine-preloader",
+    "reaper",
+    "fossilize_replay",
+    "pressure-vessel-wrap",
+    "pv-bwrap",
+    "srt-bwrap",
+    "steam-launch-wrapper",
+    "steam.exe",
+}
+# Wine's own Windows services live here; a process started from these is never the game
+WINE_SYSTEM_DIRS = ("/windows/system32/", "/windows/syswow64/")
+# Threads that run blocking callable work off Decky's event loop
+BLOCKING_POOL_MAX_WORKERS = 4
+PROGRESS_EVENT = "framegen_progress"
+# Minimum spacing between byte-count progress events; stage changes are always sent
+PROGRESS_EMIT_INTERVAL_SECONDS = 0.1
+# Upper bound on threads used to build statuses for a batch of games
+GAME_STATUS_MAX_WORKERS = 8
+BUNDLE_STATUS_EVENT = "framegen_bundle_status"
+# Coalesces a burst of filesystem events (a bundle swap touches many entries) into one refresh
+FS_EVENT_DEBOUNCE_SECONDS = 0.25
+# Bundle status re-check interval when inotify is unavailable
+BUNDLE_STATUS_POLL_SECONDS = 3.0
+INSTALLED_GAMES_EVENT = "framegen_installed_games"
+
+# ioprio_set(2) has no libc wrapper, so it is called by syscall number on the architectures SteamOS runs on
+SYS_IOPRIO_SET = {"x86_64": 251, "aarch64": 30}
+IOPRIO_WHO_PROCESS = 1
+IOPRIO_CLASS_SHIFT = 13
+IOPRIO_CLASS_IDLE = 3
+# How hard an operation may push the disk: "interactive" runs at full speed for a patch the user is
+# waiting on, "background" only uses idle I/O and CPU so a running game or Steam download is unaffected
+DEFAULT_IO_POLICY = "interactive"
+IO_POLICIES = {
+    "interactive": {
+        "workers": BLOCKING_POOL_MAX_WORKERS,
+        "nice": 0,
+        "ioprio_class": None,
+        "max_bytes_per_second": None,
+    },
+    "background": {
+        "workers": 1,
+        "nice": 19,
+        "ioprio_class": IOPRIO_CLASS_IDLE,
+        "max_bytes_per_second": 32 * 1024 * 1024,
+    },
+}
+
+# inotify(7) flags and event masks
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = os.O_CLOEXEC
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+INOTIFY_EVENT_HEADER = struct.Struct("iIII")
 
 FSR4_VARIANTS = {
     "rdna23-int8": {
@@ -104,6 +206,11 @@ INJECTOR_FILENAMES = [
     "OptiScaler.dll",
 ]
 
+# Written by the fgmod launcher once a game dir is fully deployed; lets later launches skip the copy steps
+LAUNCH_STAMP_FILENAME = ".fgmod-launch-stamp"
+# Written by update-optiscaler-config.py when a game's INI differs from the bundled one; feeds the launch stamp
+GAME_INI_ENV_NAMES_FILENAME = ".fgmod-ini-env-names"
+
 PATCH_CLEANUP_FILES = [
     *INJECTOR_FILENAMES,
     *VARIANT_EXTRA_FILENAMES,
@@ -115,6 +222,8 @@ PATCH_CLEANUP_FILES = [
     "OptiScaler.log",
     "dlssg_to_fsr3.log",
     "dlssg_to_fsr3_amd_is_better-3.0.dll",
+    LAUNCH_STAMP_FILENAME,
+    GAME_INI_ENV_NAMES_FILENAME,
 ]
 
 PATCH_FINGERPRINT_FILES = [
@@ -155,6 +264,63 @@ SUPPORT_FILES = [
 
 MARKER_FILENAME = "FRAMEGEN_PATCH"
 
+LAUNCHER_SCRIPTS = {
+    "fgmod.sh": "fgmod",
+    "fgmod-uninstaller.sh": "fgmod-uninstaller.sh",
+    "update-optiscaler-config.py": "update-optiscaler-config.py",
+    "optiscaler_ini.py": "optiscaler_ini.py",
+}
+
+BUNDLE_REQUIRED_FILES = [
+    "OptiScaler.dll",
+    "OptiScaler.ini",
+    "dlssg_to_fsr3_amd_is_better.dll",
+    "fakenvapi.dll",
+    "fakenvapi.ini",
+    "amd_fidelityfx_dx12.dll",
+    "amd_fidelityfx_framegeneration_dx12.dll",
+    FSR4_UPSCALER_FILENAME,
+    "amd_fidelityfx_vk.dll",
+    "libxess.dll",
+    "libxess_dx11.dll",
+    "libxess_fg.dll",
+    "libxell.dll",
+    *LAUNCHER_SCRIPTS.values(),
+    INSTALL_MANIFEST_FILENAME,
+]
+
+# Edits every writer applies to OptiScaler.ini, by stage: "install" for the ~/fgmod copy built from
+# the archive, "patch" for a game's copy when it is patched, and "launch" for fgmod.sh, which reads them
+# from INI_RULES_FILENAME through update-optiscaler-config.py before applying env overrides
+INI_RULES_FILENAME = "ini-rules.json"
+# Sections and keys of the bundled OptiScaler.ini, so the launcher can discard unrelated env vars by lookup
+INI_KEY_INDEX_FILENAME = "ini-key-index.json"
+INI_KEY_INDEX_SCHEMA_VERSION = 1
+# The env var names that index can act on, one per line, so fgmod.sh's launch stamp digests only those
+INI_ENV_NAMES_FILENAME = "ini-env-names.txt"
+OPTISCALER_INI_RULES = [
+    # v0.9-final split FGType into FGInput + FGOutput; INIs from older builds would silently fall back to nofg
+    {"action": "split_key", "key": "FGType", "into": ["FGInput", "FGOutput"], "stages": ["patch", "launch"]},
+    # HQ font auto mode asserts on Proton when the external TTF it looks for is missing
+    {"action": "replace_value", "key": "UseHQFont", "from": "auto", "to": "false", "stages": ["install", "patch", "launch"]},
+    {"action": "replace_value", "key": "FGInput", "from": "auto", "to": "nukems", "stages": ["install"]},
+    {"action": "replace_value", "key": "FGOutput", "from": "auto", "to": "nukems", "stages": ["install"]},
+    {"action": "replace_value", "key": "Fsr4Update", "from": "auto", "to": "true", "stages": ["install"]},
+    {"action": "replace_value", "key": "LoadAsiPlugins", "from": "auto", "to": "true", "stages": ["install"]},
+]
+
+# Ordered build steps for ~/fgmod; an incremental upgrade runs only the stale ones
+BUNDLE_BUILD_STEPS = [
+    "archive",
+    "renames",
+    "launcher_scripts",
+    "ini_rules",
+    "optipatcher",
+    "fsr4_native",
+    "fsr4_official_411_driver",
+    "fsr4_int8",
+]
+
 BAD_EXE_SUBSTRINGS = [
     "crashreport",
     "crashreportclient",
@@ -172,6 +338,41 @@ BAD_EXE_SUBSTRINGS = [
     "prereq",
 ]
 
+# Executable discovery never descends further than this below the install root
+EXE_SCAN_MAX_DEPTH = 6
+
+# Directory names (lowercase) that never hold the game executable; matched exactly, since
+# BAD_EXE_SUBSTRINGS only describe file names ("launcher" or "setup" can prefix a game's own folder)
+EXE_SCAN_PRUNED_DIRS = {
+    "_commonredist",
+    "__installer",
+    "installer",
+    "installers",
+    "redist",
+    "_redist",
+    "redistributables",
+    "directx",
+    "vcredist",
+    "prereqs",
+    "prerequisites",
+    "support",
+    "easyanticheat",
+    "battleye",
+    "movies",
+    "movie",
+    "videos",
+    "localization",
+    "localisation",
+    "shadercache",
+}
+
+# Tokens of Valve's KeyValues (VDF) text format: quoted string, brace, comment, a quoted
+# string still open at the end of the line, or an unquoted word
+VDF_TOKEN_RE = re.compile(r'"((?:[^"\\]|\\.)*)"|([{}])|//[^\n]*|("(?:[^"\\]|\\.)*\Z)|([^\s{}"]+)', re.S)
+VDF_ESCAPES = {"n": "\n", "t": "\t", "\\": "\\", '"': '"'}
+# AppState keys read from appmanifest_*.acf; parsing stops once all of them were seen
+APP_MANIFEST_KEYS = {"appid", "name", "installdir", "buildid", "sizeondisk", "stateflags"}
+
 LEGACY_FILES = [
     "dlssg_to_fsr3.ini",
     "dlssg_to_fsr3.log",
@@ -188,15 +389,546 @@ LEGACY_FILES = [
     "OptiScaler.asi",
     "OptiScaler.ini",
     "OptiScaler.log",
+    LAUNCH_STAMP_FILENAME,
+    GAME_INI_ENV_NAMES_FILENAME,
 ]
 
 class Plugin:
+    # Content hashes keyed by "dev:ino:size:mtime_ns:ctime_ns", persisted under ~/fgmod
+    _hash_cache: dict | None = None
+    _hash_cache_lock = threading.Lock()
+    # Set when digests were added since the last write; operations flush once when they finish
+    _hash_cache_dirty = False
+    # (source st_dev, target dir st_dev) -> whether FICLONE works between the two filesystems
+    _reflink_support: dict = {}
+    _reflink_support_lock = threading.Lock()
+    # Installed Steam games keyed by appid, refreshed from libraryfolders/steamapps/manifest mtimes
+    _game_registry: dict | None = None
+    _game_registry_lock = threading.Lock()
+    # Scans that outlived their deadline (library path -> Future); a library is never scanned twice at once
+    _library_scan_pool: ThreadPoolExecutor | None = None
+    _library_scans: dict = {}
+    # Shared by every get_games_status call for marker lookups, hashing and per-game status
+    _status_pool: ThreadPoolExecutor | None = None
+    # appid -> {"marker_path", "target_dir"} for every game patched through patch_game
+    _patched_index: dict | None = None
+    _patched_index_lock = threading.Lock()
+    # appid -> {"key": build key, "candidates": [exe paths]}; rescanned only when Steam updates the game
+    _exe_candidates_cache: dict = {}
+    # Last /proc scan: {"taken_at", "appids": set[str], "exe_paths": set[str]}
+    _process_snapshot_cache: dict | None = None
+    _process_snapshot_lock = threading.Lock()
+    # Worker pools for blocking callable work keyed by I/O policy, and the loop progress events are sent through
+    _worker_pools: dict = {}
+    _event_loop: asyncio.AbstractEventLoop | None = None
+    # Progress id -> {"id", "operation", "stage", "bytes_done", "bytes_total", "emitted_at"} for each
+    # running operation; install and patch can overlap, so each reports under its own id
+    _progress_states: dict = {}
+    _progress_lock = threading.Lock()
+    _next_progress_id = 1
+    # Id of the operation the current task (and the workers it dispatches to) reports progress for
+    _progress_context = contextvars.ContextVar("framegen_progress_id", default=None)
+    # {"signature", "status"} answered by check_fgmod_path until ~/fgmod changes
+    _bundle_status_cache: dict | None = None
+    # INI path -> {"signature", "lines", "sections"} for per-game OptiScaler.ini reads and edits
+    _ini_models: dict = {}
+    # Reentrant so an edit can hold it across its read-modify-write while loading the model
+    _ini_models_lock = threading.RLock()
+    # inotify descriptor shared by all filesystem watches, and wd -> handler(name, mask)
+    _inotify_fd: int | None = None
+    _inotify_handlers: dict = {}
+    _libc: ctypes.CDLL | None = None
+    # Debounced refreshes waiting to run, keyed by what they refresh ("bundle", "manifests", "libraries")
+    _fs_refresh_handles: dict = {}
+    _background_tasks: set = set()
+    # wd -> library paths sharing that steamapps directory, and appmanifest names changed per library
+    _library_watch_keys: dict = {}
+    _pending_manifest_changes: dict = {}
+    # True while every library's steamapps is watched, so the registry needs no mtime re-checks
+    _registry_watched: bool = False
+    # Flag that stops the load-time warm-up between steps
+    _warm_up_cancelled = threading.Event()
+    # I/O policy of the running callable, and of the current worker thread (set by its pool initializer)
+    _io_policy_context = contextvars.ContextVar("framegen_io_policy", default=DEFAULT_IO_POLICY)
+    _thread_state = threading.local()
+
     async def _main(self):
+        self._event_loop = asyncio.get_running_loop()
+        self._background_tasks = set()
+        self._fs_refresh_handles = {}
+        if self._start_inotify():
+            self._watch_bundle()
+            self._spawn_background(self._refresh_library_watches())
+        else:
+            decky.logger.info("inotify unavailable; polling bundle status instead")
+            self._spawn_background(self._poll_bundle_status())
+        self._warm_up_cancelled = threading.Event()
+        self._spawn_background(self._warm_up())
         decky.logger.info("Framegen plugin loaded")
 
     async def _unload(self):
+        for handle in self._fs_refresh_handles.values():
+            handle.cancel()
+        self._fs_refresh_handles = {}
+        self._stop_inotify()
+        self._warm_up_cancelled.set()
+        for task in list(self._background_tasks):
+            task.cancel()
+        for pool in self._worker_pools.values():
+            pool.shutdown(wait=False, cancel_futures=True)
+        self._worker_pools.clear()
+        if self._library_scan_pool is not None:
+            self._library_scan_pool.shutdown(wait=False, cancel_futures=True)
+            self._library_scan_pool = None
+        if self._status_pool is not None:
+            self._status_pool.shutdown(wait=False, cancel_futures=True)
+            self._status_pool = None
         decky.logger.info("Framegen plugin unloaded.")
-        
+
+    async def _run_blocking(self, func, *args, **kwargs):
+        """Run blocking filesystem/process work on the plugin's worker pool."""
+        loop = asyncio.get_running_loop()
+        self._event_loop = loop
+        io_policy = self._io_policy_context.get()
+        pool = self._worker_pools.get(io_policy)
+        if pool is None:
+            pool = ThreadPoolExecutor(
+                max_workers=IO_POLICIES[io_policy]["workers"],
+                thread_name_prefix=f"framegen-{io_policy}",
+                initializer=self._apply_thread_io_policy,
+                initargs=(io_policy,),
+            )
+            self._worker_pools[io_policy] = pool
+        # Carry the caller's context so progress reported from the worker lands on the caller's operation
+        context = contextvars.copy_context()
+        return await loop.run_in_executor(pool, functools.partial(context.run, func, *args, **kwargs))
+
+    def _normalize_io_policy(self, io_policy: str | None) -> str:
+        policy = str(io_policy or "").strip()
+        if policy in IO_POLICIES:
+            return policy
+        return DEFAULT_IO_POLICY
+
+    @contextlib.contextmanager
+    def _io_policy(self, io_policy: str | None):
+        """Run the enclosed awaits (worker pool, 7z) under the named I/O policy."""
+        token = self._io_policy_context.set(self._normalize_io_policy(io_policy))
+        try:
+            yield
+        finally:
+            self._io_policy_context.reset(token)
+
+    def _apply_thread_io_policy(self, io_policy: str) -> None:
+        """Pool initializer: remember the worker's policy and lower its CPU and I/O priority to match."""
+        policy = IO_POLICIES[io_policy]
+        self._thread_state.io_policy = io_policy
+        # On Linux both niceness and ioprio set through a thread id apply to that thread only
+        thread_id = threading.get_native_id()
+        if policy["nice"]:
+            try:
+                os.setpriority(os.PRIO_PROCESS, thread_id, policy["nice"])
+            except OSError as e:
+                decky.logger.warning(f"Could not lower {io_policy} worker CPU priority: {e}")
+        if policy["ioprio_class"] is not None:
+            syscall_number = SYS_IOPRIO_SET.get(os.uname().machine)
+            if syscall_number is None:
+                return
+            libc = ctypes.CDLL(None, use_errno=True)
+            ioprio = policy["ioprio_class"] << IOPRIO_CLASS_SHIFT
+            if libc.syscall(syscall_number, IOPRIO_WHO_PROCESS, thread_id, ioprio) != 0:
+                decky.logger.warning(
+                    f"Could not lower {io_policy} worker I/O priority: {os.strerror(ctypes.get_errno())}"
+                )
+
+    def _io_bandwidth_limit(self) -> int | None:
+        io_policy = getattr(self._thread_state, "io_policy", DEFAULT_IO_POLICY)
+        return IO_POLICIES[io_policy]["max_bytes_per_second"]
+
+    async def _run_tracked(self, operation: str, func, *args, **kwargs) -> dict:
+        """_run_blocking for operations returning a status dict, bracketed by progress events."""
+        progress_id = self._begin_progress(operation)
+        token = self._progress_context.set(progress_id)
+        result: dict = {}
+        try:
+            result = await self._run_blocking(func, *args, **kwargs)
+            return result
+        finally:
+            await self._run_blocking(self._flush_hash_cache)
+            self._progress_context.reset(token)
+            self._end_progress(progress_id, "done" if result.get("status") == "success" else "error")
+
+    # ── Progress events ───────────────────────────────────────────────────────
+
+    def _begin_progress(self, operation: str, bytes_total: int = 0) -> int:
+        """Open a progress slot for operation; returns the id its events carry."""
+        with self._progress_lock:
+            progress_id = self._next_progress_id
+            self._next_progress_id += 1
+            self._progress_states[progress_id] = {
+                "id": progress_id,
+                "operation": operation,
+                "stage": "start",
+                "bytes_done": 0,
+                "bytes_total": bytes_total,
+                "emitted_at": 0.0,
+            }
+        self._emit_progress(progress_id, force=True)
+        return progress_id
+
+    def _set_progress_stage(self, stage: str, bytes_total: int | None = None, progress_id: int | None = None) -> None:
+        if progress_id is None:
+            progress_id = self._progress_context.get()
+        with self._progress_lock:
+            state = self._progress_states.get(progress_id)
+            if state is None:
+                return
+            state["stage"] = stage
+            if bytes_total is not None:
+                state["bytes_total"] = bytes_total
+        self._emit_progress(progress_id, force=True)
+
+    def _advance_progress(self, byte_count: int) -> None:
+        progress_id = self._progress_context.get()
+        with self._progress_lock:
+            state = self._progress_states.get(progress_id)
+            if state is None:
+                return
+            state["bytes_done"] += byte_count
+        self._emit_progress(progress_id)
+
+    def _end_progress(self, progress_id: int, stage: str) -> None:
+        self._set_progress_stage(stage, progress_id=progress_id)
+        with self._progress_lock:
+            self._progress_states.pop(progress_id, None)
+
+    def _emit_progress(self, progress_id: int, force: bool = False) -> None:
+        """Send an operation's progress to the frontend; safe to call from worker threads."""
+        loop = self._event_loop
+        with self._progress_lock:
+            state = self._progress_states.get(progress_id)
+            if state is None or loop is None:
+                return
+            now = time.monotonic()
+            if not force and now - state["emitted_at"] < PROGRESS_EMIT_INTERVAL_SECONDS:
+                return
+            state["emitted_at"] = now
+            payload = {key: value for key, value in state.items() if key != "emitted_at"}
+        if payload["bytes_total"]:
+            # Small files outside the planned total (INI, scripts) must not push past 100%
+            payload["bytes_done"] = min(payload["bytes_done"], payload["bytes_total"])
+        if loop.is_closed():
+            return
+        emit = decky.emit(PROGRESS_EVENT, payload)
+        try:
+            asyncio.run_coroutine_threadsafe(emit, loop)
+        except RuntimeError:
+            emit.close()
+
+    def _spawn_background(self, coro) -> asyncio.Task:
+        """Start a task owned by the plugin; _unload cancels whatever is still running."""
+        task = self._event_loop.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        return task
+
+    async def _warm_up(self) -> None:
+        """Build the caches the panel needs on first open, on the background-priority worker."""
+        started = time.monotonic()
+        try:
+            with self._io_policy("background"):
+                await self._run_blocking(self._warm_caches, self._warm_up_cancelled)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            decky.logger.error(f"Cache warm-up failed: {e}")
+            return
+        decky.logger.info(f"Cache warm-up finished in {time.monotonic() - started:.2f}s")
+
+    def _warm_caches(self, cancelled: threading.Event) -> None:
+        self._bundle_status()
+        games = self._installed_games_by_appid()
+        if cancelled.is_set():
+            return
+        patched_index = self._load_patched_index()
+        with self._patched_index_lock:
+            patched = list(patched_index)
+        for appid in patched:
+            if cancelled.is_set():
+                break
+            game_info = games.get(appid)
+            if not game_info or self._is_library_stale(game_info):
+                continue
+            marker = self._marker_for_game(appid, Path(game_info["install_path"]))
+            if not marker:
+                continue
+            # The same files get_games_status hashes to report each game's FSR4 variant
+            target_dir = Path(self._read_marker(marker).get("target_dir", str(marker.parent)))
+            for filename in (FSR4_UPSCALER_FILENAME, *VARIANT_EXTRA_FILENAMES):
+                path = target_dir / filename
+                if path.is_file():
+                    self._file_sha256(path)
+        self._flush_hash_cache()
+
+    def _start_inotify(self) -> bool:
+        try:
+            libc = ctypes.CDLL(None, use_errno=True)
+            fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        except (OSError, AttributeError) as e:
+            decky.logger.warning(f"inotify not available: {e}")
+            return False
+        if fd < 0:
+            decky.logger.warning(f"inotify_init1 failed: {os.strerror(ctypes.get_errno())}")
+            return False
+        self._libc = libc
+        self._inotify_fd = fd
+        self._inotify_handlers = {}
+        self._event_loop.add_reader(fd, self._drain_inotify)
+        return True
+
+    def _stop_inotify(self) -> None:
+        fd = self._inotify_fd
+        if fd is None:
+            return
+        self._inotify_fd = None
+        self._inotify_handlers = {}
+        self._library_watch_keys = {}
+        self._registry_watched = False
+        loop = self._event_loop
+        if loop is not None and not loop.is_closed():
+            loop.remove_reader(fd)
+        os.close(fd)
+
+    def _add_watch(self, path: Path, mask: int, handler) -> int | None:
+        """Watch a directory; handler(name, mask) runs on the event loop for each event."""
+        if self._inotify_fd is None:
+            return None
+        wd = self._libc.inotify_add_watch(self._inotify_fd, os.fsencode(str(path)), mask)
+        if wd < 0:
+            decky.logger.warning(f"Cannot watch {path}: {os.strerror(ctypes.get_errno())}")
+            return None
+        # Re-adding a watch for the same inode returns the same wd, so the newest handler wins
+        self._inotify_handlers[wd] = handler
+        return wd
+
+    def _drain_inotify(self) -> None:
+        try:
+            data = os.read(self._inotify_fd, 64 * 1024)
+        except (BlockingIOError, TypeError):
+            return
+        except OSError as e:
+            decky.logger.error(f"Reading inotify events failed: {e}")
+            return
+        offset = 0
+        while offset + INOTIFY_EVENT_HEADER.size <= len(data):
+            wd, mask, _cookie, length = INOTIFY_EVENT_HEADER.unpack_from(data, offset)
+            start = offset + INOTIFY_EVENT_HEADER.size
+            name = data[start:start + length].rstrip(b"\0").decode("utf-8", "replace")
+            offset = start + length
+            if mask & IN_Q_OVERFLOW:
+                # Events were dropped; every watcher has to assume it missed something
+                handlers = list(self._inotify_handlers.values())
+            elif mask & IN_IGNORED:
+                # The watch is gone (directory removed or unmounted); its handler sees this last event
+                handlers = [self._inotify_handlers.pop(wd, None)]
+            else:
+                handlers = [self._inotify_handlers.get(wd)]
+            for handler in handlers:
+                if handler is None:
+                    continue
+                try:
+                    handler(name, mask)
+                except Exception as e:
+                    decky.logger.error(f"inotify handler failed for {name!r}: {e}")
+
+    def _watch_bundle(self) -> None:
+        # ~/fgmod itself is replaced by an atomic swap on install, so its parent is watched as well
+        self._add_watch(
+            Path(decky.HOME),
+            IN_CREATE | IN_DELETE | IN_MOVED_FROM | IN_MOVED_TO | IN_ONLYDIR,
+            self._on_home_event,
+        )
+        self._watch_fgmod_dir()
+
+    def _watch_fgmod_dir(self) -> None:
+        fgmod_path = Path(decky.HOME) / "fgmod"
+        if not fgmod_path.is_dir():
+            return
+        self._add_watch(
+            fgmod_path,
+            IN_CLOSE_WRITE | IN_CREATE | IN_DELETE | IN_MOVED_FROM | IN_MOVED_TO | IN_DELETE_SELF | IN_ONLYDIR,
+            self._on_bundle_event,
+        )
+        for subdir in self._bundle_status_dirs(fgmod_path):
+            self._watch_bundle_subdir(subdir)
+
+    def _watch_bundle_subdir(self, subdir: Path) -> None:
+        if subdir.is_dir():
+            self._add_watch(
+                subdir,
+                IN_CLOSE_WRITE | IN_CREATE | IN_DELETE | IN_MOVED_FROM | IN_MOVED_TO | IN_DELETE_SELF | IN_ONLYDIR,
+                self._on_bundle_event,
+            )
+
+    def _on_home_event(self, name: str, mask: int) -> None:
+        if name != "fgmod":
+            return
+        if mask & (IN_CREATE | IN_MOVED_TO):
+            self._watch_fgmod_dir()
+        self._schedule_fs_refresh("bundle", self._refresh_bundle_status)
+
+    def _on_bundle_event(self, name: str, mask: int) -> None:
+        if mask & (IN_CREATE | IN_MOVED_TO):
+            # A plugins/ or variant directory put back into ~/fgmod needs its own watch again
+            fgmod_path = Path(decky.HOME) / "fgmod"
+            subdir = fgmod_path / name
+            if subdir in self._bundle_status_dirs(fgmod_path):
+                self._watch_bundle_subdir(subdir)
+        self._schedule_fs_refresh("bundle", self._refresh_bundle_status)
+
+    def _schedule_fs_refresh(self, key: str, refresh) -> None:
+        """Run the refresh coroutine function once the burst of events for key has settled."""
+        if key in self._fs_refresh_handles:
+            return
+
+        def fire():
+            self._fs_refresh_handles.pop(key, None)
+            self._spawn_background(refresh())
+
+        self._fs_refresh_handles[key] = self._event_loop.call_later(FS_EVENT_DEBOUNCE_SECONDS, fire)
+
+    def _on_steamapps_event(self, library_keys: list[str], name: str, mask: int) -> None:
+        if mask & (IN_IGNORED | IN_Q_OVERFLOW) or name == "libraryfolders.vdf":
+            # A library appeared, went away or events were lost; rescan and re-attach the watches
+            self._registry_watched = False
+            self._schedule_fs_refresh("libraries", self._refresh_library_watches)
+        elif name.startswith("appmanifest_") and name.endswith(".acf"):
+            for key in library_keys:
+                self._pending_manifest_changes.setdefault(key, set()).add(name)
+            self._schedule_fs_refresh("manifests", self._apply_pending_manifest_changes)
+
+    async def _refresh_library_watches(self) -> None:
+        """Rescan all libraries and watch the steamapps directory of every reachable one."""
+        try:
+            previous = self._game_registry["games"] if self._game_registry else None
+            games = await self._run_blocking(self._installed_games_by_appid, True)
+            registry = self._game_registry
+            wanted = {
+                str(library_path)
+                for library_path in registry["library_paths"]
+                if str(library_path) in registry["libraries"]
+            } - registry["stale_libraries"]
+
+            for wd, keys in list(self._library_watch_keys.items()):
+                if wd not in self._inotify_handlers:
+                    del self._library_watch_keys[wd]
+                elif not wanted.intersection(keys):
+                    del self._library_watch_keys[wd]
+                    # Drop the handler first so the IN_IGNORED this causes is not mistaken for a lost library
+                    self._inotify_handlers.pop(wd, None)
+                    self._libc.inotify_rm_watch(self._inotify_fd, wd)
+
+            watched = {key for keys in self._library_watch_keys.values() for key in keys}
+            for key in sorted(wanted - watched):
+                keys = [key]
+                handler = functools.partial(self._on_steamapps_event, keys)
+                wd = await self._run_blocking(
+                    self._add_watch,
+                    Path(key) / "steamapps",
+                    IN_CLOSE_WRITE | IN_CREATE | IN_DELETE | IN_MOVED_FROM | IN_MOVED_TO | IN_ONLYDIR,
+                    handler,
+                )
+                if wd is None:
+                    continue
+                if wd in self._library_watch_keys:
+                    # Another library path (a symlinked Steam root) resolves to the same directory
+                    keys = self._library_watch_keys[wd]
+                    keys.append(key)
+                    self._inotify_handlers[wd] = functools.partial(self._on_steamapps_event, keys)
+                else:
+                    self._library_watch_keys[wd] = keys
+                watched.add(key)
+
+            self._registry_watched = self._inotify_fd is not None and wanted <= watched and not registry["stale_libraries"]
+            if previous is not None and games != previous:
+                await decky.emit(INSTALLED_GAMES_EVENT)
+        except Exception as e:
+            decky.logger.error(f"Refreshing Steam library watches failed: {e}")
+
+    async def _apply_pending_manifest_changes(self) -> None:
+        changes = self._pending_manifest_changes
+        self._pending_manifest_changes = {}
+        try:
+            if await self._run_blocking(self._apply_manifest_changes, changes):
+                await decky.emit(INSTALLED_GAMES_EVENT)
+        except Exception as e:
+            decky.logger.error(f"Applying Steam manifest changes failed: {e}")
+
+    async def _poll_bundle_status(self) -> None:
+        while True:
+            await asyncio.sleep(BUNDLE_STATUS_POLL_SECONDS)
+            await self._refresh_bundle_status()
+
+    async def _refresh_bundle_status(self) -> None:
+        """Recompute the bundle status and tell the frontend when it differs from the last one."""
+        try:
+            cached = self._bundle_status_cache
+            previous = cached["status"] if cached else None
+            status = await self._run_blocking(self._bundle_status)
+            if status != previous:
+                await decky.emit(BUNDLE_STATUS_EVENT, status)
+        except Exception as e:
+            decky.logger.error(f"Bundle status refresh failed: {e}")
+
+    def _bundle_status_dirs(self, fgmod_path: Path) -> list[Path]:
+        """Subdirectories holding files _missing_bundle_files checks, besides ~/fgmod itself."""
+        names = dict.fromkeys(["plugins", *(variant["dir_name"] for variant in FSR4_VARIANTS.values())])
+        return [fgmod_path / name for name in names]
+
+    def _bundle_status_signature(self) -> tuple:
+        fgmod_path = Path(decky.HOME) / "fgmod"
+        signature = []
+        paths = [
+            fgmod_path,
+            self._install_manifest_path(fgmod_path),
+            fgmod_path / VERSION_FILENAME,
+            *self._bundle_status_dirs(fgmod_path),
+        ]
+        for path in paths:
+            try:
+                signature.append(self._stat_signature(os.stat(path)))
+            except OSError:
+                signature.append(None)
+        return tuple(signature)
+
+    def _bundle_status(self) -> dict:
+        # Adding, removing or replacing a file changes its directory's mtime, so the stats of ~/fgmod,
+        # plugins/, the variant directories and the manifest tell whether the cached status still holds
+        signature = self._bundle_status_signature()
+        cached = self._bundle_status_cache
+        if cached and cached["signature"] == signature:
+            return cached["status"]
+        status = self._compute_bundle_status()
+        self._bundle_status_cache = {"signature": signature, "status": status}
+        return status
+
+    def _compute_bundle_status(self) -> dict:
+        path = Path(decky.HOME) / "fgmod"
+        if not path.exists():
+            return {"exists": False}
+
+        if self._missing_bundle_files(path):
+            return {"exists": False}
+
+        manifest = self._load_install_manifest(path)
+        selected_variant = self._selected_fsr4_variant(path, manifest=manifest)
+        return {
+            "exists": True,
+            "version": self._fgmod_version(path, manifest=manifest),
+            "selected_fsr4_variant": selected_variant,
+            "selected_fsr4_variant_label": FSR4_VARIANTS[selected_variant]["label"],
+            "install_manifest_present": bool(manifest),
+        }
+
     def _create_renamed_copies(self, source_file, renames_dir):
         """Create renamed copies of the OptiScaler.dll file"""
         try:
@@ -213,9 +945,9 @@ class Plugin:
             ]
             
             if source_file.exists():
-                for rename_file in rename_files:
-                    dest_file = renames_dir / rename_file
-                    shutil.copy2(source_file, dest_file)
+                dest_files = [renames_dir / rename_file for rename_file in rename_files]
+                self._link_bundle_files(source_file.parent, source_file, dest_files, None, "OptiScaler proxy")
+                for dest_file in dest_files:
                     decky.logger.info(f"Created renamed copy: {dest_file}")
                 return True
             else:
@@ -227,40 +959,28 @@ class Plugin:
             return False
     
     def _copy_launcher_scripts(self, assets_dir, extract_path):
-        """Copy launcher scripts from assets directory"""
+        """Copy launcher scripts from assets directory, skipping ones that are already current"""
         try:
-            # Copy fgmod script
-            fgmod_script_src = assets_dir / "fgmod.sh"
-            fgmod_script_dest = extract_path / "fgmod"
-            if fgmod_script_src.exists():
-                shutil.copy2(fgmod_script_src, fgmod_script_dest)
-                fgmod_script_dest.chmod(0o755)
-                decky.logger.info(f"Copied fgmod script to {fgmod_script_dest}")
-            
-            # Copy uninstaller script
-            uninstaller_src = assets_dir / "fgmod-uninstaller.sh"
-            uninstaller_dest = extract_path / "fgmod-uninstaller.sh"
-            if uninstaller_src.exists():
-                shutil.copy2(uninstaller_src, uninstaller_dest)
-                uninstaller_dest.chmod(0o755)
-                decky.logger.info(f"Copied uninstaller script to {uninstaller_dest}")
-
-            # Copy optiscaler config updater script
-            optiscaler_config_updater_src = assets_dir / "update-optiscaler-config.py"
-            optiscaler_config_updater_dest = extract_path / "update-optiscaler-config.py"
-            if optiscaler_config_updater_src.exists():
-                shutil.copy2(optiscaler_config_updater_src, optiscaler_config_updater_dest)
-                optiscaler_config_updater_dest.chmod(0o755)
-                decky.logger.info(f"Copied update-optiscaler-config.py script to {optiscaler_config_updater_dest}")
-                
+            for script_name, dest_name in LAUNCHER_SCRIPTS.items():
+                script_src = assets_dir / script_name
+                script_dest = extract_path / dest_name
+                if not script_src.exists() or self._files_match(script_src, script_dest):
+                    continue
+                self._copy_verified(script_src, script_dest, None, f"Launcher script {script_name}")
+                script_dest.chmod(0o755)
+                decky.logger.info(f"Copied {script_name} to {script_dest}")
             return True
         except Exception as e:
             decky.logger.error(f"Failed to copy launcher scripts: {e}")
             return False
-    
+
     def _files_match(self, file_a: Path, file_b: Path) -> bool:
         try:
-            return file_a.exists() and file_b.exists() and filecmp.cmp(file_a, file_b, shallow=False)
+            if not file_a.is_file() or not file_b.is_file():
+                return False
+            if file_a.stat().st_size != file_b.stat().st_size:
+                return False
+            return self._file_sha256(file_a) == self._file_sha256(file_b)
         except Exception:
             return False
 
@@ -268,29 +988,95 @@ class Plugin:
         bundled_copy = fgmod_path / "renames" / file_path.name
         return self._files_match(file_path, bundled_copy)
 
-    def _has_patch_fingerprint(self, directory: Path) -> bool:
-        return any((directory / filename).exists() for filename in PATCH_FINGERPRINT_FILES)
+    def _directory_entries(self, directory: Path) -> set[str]:
+        """Names directly inside directory, from a single scandir pass."""
+        try:
+            with os.scandir(directory) as entries:
+                return {entry.name for entry in entries}
+        except FileNotFoundError:
+            return set()
 
-    def _backup_preexisting_proxy_files(self, directory: Path, fgmod_path: Path) -> list[str]:
+    def _has_patch_fingerprint(self, present: set[str]) -> bool:
+        return not present.isdisjoint(PATCH_FINGERPRINT_FILES)
+
+    def _backup_preexisting_proxy_files(self, directory: Path, fgmod_path: Path, present: set[str]) -> list[str]:
+        """Move unmanaged proxy DLLs aside, keeping the present snapshot in step with the moves."""
+        if self._has_patch_fingerprint(present):
+            return []
         backed_up: list[str] = []
-        already_patched = self._has_patch_fingerprint(directory)
         for filename in PROXY_DLL_BACKUPS:
-            source = directory / filename
-            backup = directory / f"{filename}.b"
-            if not source.exists() or backup.exists():
+            if filename not in present or f"{filename}.b" in present:
                 continue
-            if already_patched or self._is_bundled_proxy_copy(source, fgmod_path):
+            source = directory / filename
+            if self._is_bundled_proxy_copy(source, fgmod_path):
                 continue
-            shutil.move(source, backup)
+            shutil.move(source, directory / f"{filename}.b")
+            present.discard(filename)
+            present.add(f"{filename}.b")
             backed_up.append(filename)
         return backed_up
 
-    def _file_sha256(self, path: Path) -> str:
+    def _stat_signature(self, stat_result: os.stat_result) -> str:
+        # ctime catches in-place rewrites that restore the old mtime
+        return (
+            f"{stat_result.st_dev}:{stat_result.st_ino}:{stat_result.st_size}:"
+            f"{stat_result.st_mtime_ns}:{stat_result.st_ctime_ns}"
+        )
+
+    def _hash_cache_path(self) -> Path:
+        return Path(decky.HOME) / "fgmod" / HASH_CACHE_FILENAME
+
+    def _load_hash_cache(self) -> dict:
+        if self._hash_cache is None:
+            entries = self._read_json_file(self._hash_cache_path()).get("entries")
+            self._hash_cache = entries if isinstance(entries, dict) else {}
+        return self._hash_cache
+
+    def _save_hash_cache(self) -> None:
+        cache_path = self._hash_cache_path()
+        if not cache_path.parent.is_dir():
+            return
+        cache = self._load_hash_cache()
+        while len(cache) > HASH_CACHE_MAX_ENTRIES:
+            cache.pop(next(iter(cache)))
+        try:
+            self._write_json_file(cache_path, {"schema_version": 1, "entries": cache})
+            self._hash_cache_dirty = False
+        except Exception as exc:
+            decky.logger.warning(f"Failed to persist hash cache: {exc}")
+
+    def _flush_hash_cache(self) -> None:
+        """Persist digests added by the operation that just finished, if there are any."""
+        with self._hash_cache_lock:
+            if self._hash_cache_dirty:
+                self._save_hash_cache()
+
+    def _file_sha256(self, path: Path, save: bool = False) -> str:
+        """Return the SHA-256 of a file, reusing the cached digest while its stat signature is unchanged.
+
+        New digests stay in memory until the operation calls _flush_hash_cache; pass save=True
+        only for a one-off lookup outside any operation.
+        """
+        signature = self._stat_signature(os.stat(path))
+        with self._hash_cache_lock:
+            cached = self._load_hash_cache().get(signature)
+        if cached:
+            return cached
+
         digest = hashlib.sha256()
         with open(path, "rb") as f:
             for chunk in iter(lambda: f.read(1024 * 1024), b""):
                 digest.update(chunk)
-        return digest.hexdigest()
+        sha256 = digest.hexdigest()
+
+        # Only remember the digest if the file did not change while it was being read
+        if self._stat_signature(os.stat(path)) == signature:
+            with self._hash_cache_lock:
+                self._load_hash_cache()[signature] = sha256
+                self._hash_cache_dirty = True
+                if save:
+                    self._save_hash_cache()
+        return sha256
 
     def _read_json_file(self, path: Path) -> dict:
         try:
@@ -301,32 +1087,299 @@ class Plugin:
             return {}
 
     def _write_json_file(self, path: Path, payload: dict) -> None:
-        with open(path, "w", encoding="utf-8") as f:
+        tmp_path = path.with_name(f".{path.name}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
             json.dump(payload, f, indent=2)
+        os.replace(tmp_path, path)
 
-    def _extract_archive(self, archive_path: Path, output_dir: Path, members: list[str] | None = None) -> None:
+    async def _extract_archive(self, archive_path: Path, output_dir: Path, members: list[str] | None = None) -> None:
+        """Run 7z as an async subprocess, turning its percentage output into progress events."""
         output_dir.mkdir(parents=True, exist_ok=True)
         extract_cmd = [
             "7z",
             "x",
             "-y",
+            "-bso0",
+            "-bsp1",
             "-o" + str(output_dir),
             str(archive_path),
         ]
         if members:
             extract_cmd.extend(members)
+        policy = IO_POLICIES[self._io_policy_context.get()]
+        if policy["ioprio_class"] is not None and shutil.which("ionice"):
+            extract_cmd = ["ionice", "-c", str(policy["ioprio_class"]), *extract_cmd]
+        if policy["nice"] and shutil.which("nice"):
+            extract_cmd = ["nice", "-n", str(policy["nice"]), *extract_cmd]
 
         clean_env = os.environ.copy()
         clean_env["LD_LIBRARY_PATH"] = ""
-        result = subprocess.run(
-            extract_cmd,
-            capture_output=True,
-            text=True,
-            check=False,
+        process = await asyncio.create_subprocess_exec(
+            *extract_cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
             env=clean_env,
         )
-        if result.returncode != 0:
-            raise RuntimeError(result.stderr or result.stdout or f"Failed to extract {archive_path.name}")
+        archive_size = archive_path.stat().st_size
+        reported = 0
+
+        async def read_progress() -> bytes:
+            nonlocal reported
+            output = b""
+            while True:
+                chunk = await process.stdout.read(4096)
+                if not chunk:
+                    break
+                output = (output + chunk)[-4096:]
+                percentages = re.findall(rb"(\d+)%", chunk)
+                if percentages:
+                    done = archive_size * min(int(percentages[-1]), 100) // 100
+                    if done > reported:
+                        self._advance_progress(done - reported)
+                        reported = done
+            return output
+
+        stdout, stderr = await asyncio.gather(read_progress(), process.stderr.read())
+        returncode = await process.wait()
+        if returncode != 0:
+            message = (stderr or stdout).decode("utf-8", "replace").strip()
+            raise RuntimeError(message or f"Failed to extract {archive_path.name}")
+        self._advance_progress(archive_size - reported)
+
+    def _remember_file_sha256(self, path: Path, sha256: str) -> None:
+        with self._hash_cache_lock:
+            self._load_hash_cache()[self._stat_signature(os.stat(path))] = sha256
+            self._hash_cache_dirty = True
+
+    def _cached_file_sha256(self, path: Path) -> str | None:
+        with self._hash_cache_lock:
+            return self._load_hash_cache().get(self._stat_signature(os.stat(path)))
+
+    def _link_keeping_digest(self, source: Path, link_path: Path) -> None:
+        """os.link that carries source's cached digest over the ctime change the new link causes."""
+        cached = self._cached_file_sha256(source)
+        os.link(source, link_path)
+        if cached:
+            self._remember_file_sha256(link_path, cached)
+
+    def _copy_verified(
+        self,
+        source: Path,
+        destinations: Path | list[Path],
+        expected_sha256: str | None,
+        description: str,
+    ) -> str:
+        """Copy source to one or more destinations in a single read, hashing the streamed bytes.
+
+        Each destination is written to a temporary sibling and renamed into place, so
+        existing files (and any hardlinks to them) are never truncated. When
+        expected_sha256 is given, a mismatch discards the copies and raises.
+        """
+        targets = [destinations] if isinstance(destinations, Path) else list(destinations)
+        partials = [target.with_name(f".{target.name}.partial") for target in targets]
+        digest = hashlib.sha256()
+        handles = []
+        bandwidth_limit = self._io_bandwidth_limit()
+        started = time.monotonic()
+        copied = 0
+        try:
+            for partial in partials:
+                handles.append(open(partial, "wb"))
+            with open(source, "rb") as src:
+                for chunk in iter(lambda: src.read(1024 * 1024), b""):
+                    digest.update(chunk)
+                    for handle in handles:
+                        handle.write(chunk)
+                    self._advance_progress(len(chunk))
+                    copied += len(chunk)
+                    if bandwidth_limit:
+                        ahead = copied / bandwidth_limit - (time.monotonic() - started)
+                        if ahead > 0:
+                            time.sleep(ahead)
+        except Exception:
+            for handle in handles:
+                handle.close()
+            for partial in partials:
+                partial.unlink(missing_ok=True)
+            raise
+        for handle in handles:
+            handle.close()
+
+        actual_sha256 = digest.hexdigest()
+        if expected_sha256 and actual_sha256.lower() != expected_sha256.lower():
+            for partial in partials:
+                partial.unlink(missing_ok=True)
+            raise RuntimeError(
+                f"{description} hash mismatch: expected {expected_sha256}, got {actual_sha256}"
+            )
+
+        for partial, target in zip(partials, targets):
+            shutil.copystat(source, partial)
+            os.replace(partial, target)
+            self._remember_file_sha256(target, actual_sha256)
+        self._remember_file_sha256(source, actual_sha256)
+        return actual_sha256
+
+    def _bundle_object_path(self, fgmod_path: Path, sha256: str) -> Path:
+        return fgmod_path / BUNDLE_OBJECTS_DIRNAME / sha256[:2] / sha256
+
+    def _replace_with_hardlink(self, source: Path, target: Path) -> None:
+        # rename() is a no-op between two links to the same inode, so skip those up front
+        if target.exists() and os.path.samefile(source, target):
+            return
+        link_path = target.with_name(f".{target.name}.link")
+        link_path.unlink(missing_ok=True)
+        cached = self._cached_file_sha256(source)
+        os.link(source, link_path)
+        os.replace(link_path, target)
+        if cached:
+            # Both the link and the rename bump ctime on the shared inode
+            self._remember_file_sha256(target, cached)
+
+    def _store_bundle_object(self, fgmod_path: Path, path: Path) -> Path:
+        """Make path a hardlink of the bundle's single stored copy of its content."""
+        object_path = self._bundle_object_path(fgmod_path, self._file_sha256(path))
+        if object_path.exists():
+            if not os.path.samefile(object_path, path):
+                self._replace_with_hardlink(object_path, path)
+        else:
+            object_path.parent.mkdir(parents=True, exist_ok=True)
+            self._link_keeping_digest(path, object_path)
+        return object_path
+
+    def _link_bundle_files(
+        self,
+        fgmod_path: Path,
+        source: Path,
+        targets: list[Path],
+        expected_sha256: str | None,
+        description: str,
+    ) -> str:
+        """Expose source's content at each target path as hardlinks into the bundle object store."""
+        actual_sha256 = self._file_sha256(source)
+        if expected_sha256 and actual_sha256.lower() != expected_sha256.lower():
+            raise RuntimeError(
+                f"{description} hash mismatch: expected {expected_sha256}, got {actual_sha256}"
+            )
+        try:
+            object_path = self._store_bundle_object(fgmod_path, source)
+            for target in targets:
+                if not (target.exists() and os.path.samefile(object_path, target)):
+                    self._replace_with_hardlink(object_path, target)
+        except OSError as exc:
+            decky.logger.warning(f"Hardlinking {description} failed, copying instead: {exc}")
+            self._copy_verified(source, targets, expected_sha256, description)
+        return actual_sha256
+
+    def _dedupe_bundle(self, fgmod_path: Path) -> None:
+        """Collapse identical DLLs in the bundle onto one content-addressed object each."""
+        objects_dir = fgmod_path / BUNDLE_OBJECTS_DIRNAME
+        for root, dirs, files in os.walk(fgmod_path):
+            root_path = Path(root)
+            if root_path == fgmod_path and BUNDLE_OBJECTS_DIRNAME in dirs:
+                dirs.remove(BUNDLE_OBJECTS_DIRNAME)
+            for filename in files:
+                path = root_path / filename
+                if path.suffix.lower() not in READ_ONLY_PAYLOAD_SUFFIXES or filename.startswith("."):
+                    continue
+                try:
+                    self._store_bundle_object(fgmod_path, path)
+                except OSError as exc:
+                    decky.logger.warning(f"Could not deduplicate {path}: {exc}")
+                    return
+        decky.logger.info(f"Deduplicated bundle DLLs into {objects_dir}")
+
+    def _prune_bundle_objects(self, fgmod_path: Path) -> None:
+        """Drop stored objects that no bundle path links to any more."""
+        objects_dir = fgmod_path / BUNDLE_OBJECTS_DIRNAME
+        if not objects_dir.is_dir():
+            return
+        for bucket in objects_dir.iterdir():
+            if not bucket.is_dir():
+                continue
+            for object_path in bucket.iterdir():
+                try:
+                    if object_path.stat().st_nlink <= 1:
+                        object_path.unlink()
+                except OSError:
+                    continue
+            try:
+                bucket.rmdir()
+            except OSError:
+                pass
+
+    def _reflink_file(self, source: Path, target: Path) -> bool:
+        """Clone source into target with FICLONE; False if the filesystem cannot share extents.
+
+        Support is probed once per pair of filesystems, so later files skip the attempt entirely.
+        """
+        try:
+            devices = (source.stat().st_dev, target.parent.stat().st_dev)
+        except OSError:
+            return False
+        with self._reflink_support_lock:
+            if self._reflink_support.get(devices) is False:
+                return False
+        partial = target.with_name(f".{target.name}.partial")
+        try:
+            with open(source, "rb") as src, open(partial, "wb") as dst:
+                fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+        except OSError as exc:
+            partial.unlink(missing_ok=True)
+            if exc.errno in (errno.EOPNOTSUPP, errno.ENOTTY, errno.EXDEV, errno.EINVAL, errno.ENOSYS):
+                with self._reflink_support_lock:
+                    self._reflink_support[devices] = False
+            return False
+        with self._reflink_support_lock:
+            self._reflink_support[devices] = True
+        shutil.copystat(source, partial)
+        os.replace(partial, target)
+        self._remember_file_sha256(target, self._file_sha256(source))
+        return True
+
+    def _deploy_file(self, source: Path, target: Path) -> str:
+        """Place source at target by reflink, hardlink (read-only payloads) or copy; returns the method used.
+
+        The target is always replaced by rename, so a previously hardlinked target never
+        writes through to the bundle.
+        """
+        if self._reflink_file(source, target):
+            return "reflink"
+        if source.suffix.lower() in READ_ONLY_PAYLOAD_SUFFIXES:
+            try:
+                if source.stat().st_dev == target.parent.stat().st_dev:
+                    self._replace_with_hardlink(source, target)
+                    return "hardlink"
+            except OSError as exc:
+                decky.logger.info(f"Hardlink deploy of {source.name} unavailable, copying: {exc}")
+        self._copy_verified(source, target, None, source.name)
+        return "copy"
+
+    def _tree_files(self, source_dir: Path, prefix: str) -> dict[str, Path]:
+        files: dict[str, Path] = {}
+        for root, _dirs, filenames in os.walk(source_dir):
+            relative_root = Path(root).relative_to(source_dir)
+            for filename in filenames:
+                files[(Path(prefix) / relative_root / filename).as_posix()] = Path(root) / filename
+        return files
+
+    def _deployed_file_current(self, source: Path, target: Path) -> bool:
+        """True when target already holds source's content (same inode, or same size and cached digest)."""
+        try:
+            target_stat = target.stat()
+            source_stat = source.stat()
+        except OSError:
+            return False
+        if not stat.S_ISREG(target_stat.st_mode):
+            return False
+        if (target_stat.st_dev, target_stat.st_ino) == (source_stat.st_dev, source_stat.st_ino):
+            return True
+        if target_stat.st_size != source_stat.st_size:
+            return False
+        try:
+            return self._file_sha256(source) == self._file_sha256(target)
+        except OSError:
+            return False
 
     def _verify_bundled_asset(self, path: Path, expected_sha256: str, description: str) -> str:
         actual_sha256 = self._file_sha256(path)
@@ -336,6 +1389,262 @@ class Plugin:
             )
         return actual_sha256
 
+    def _file_has_sha256(self, path: Path, expected_sha256: str) -> bool:
+        try:
+            return path.is_file() and self._file_sha256(path).lower() == expected_sha256.lower()
+        except Exception:
+            return False
+
+    def _missing_bundle_files(self, fgmod_path: Path) -> list[str]:
+        missing = [name for name in BUNDLE_REQUIRED_FILES if not (fgmod_path / name).exists()]
+        if not (fgmod_path / "plugins" / "OptiPatcher.asi").exists():
+            missing.append("plugins/OptiPatcher.asi")
+        for variant in FSR4_VARIANTS.values():
+            variant_dir = fgmod_path / variant["dir_name"]
+            for filename in [FSR4_UPSCALER_FILENAME, *(extra["name"] for extra in variant.get("extra_files", []))]:
+                if not (variant_dir / filename).exists():
+                    missing.append(f"{variant['dir_name']}/{filename}")
+        return missing
+
+    def _bundle_upgrade_plan(self, fgmod_path: Path, assets_dir: Path) -> list[str]:
+        """Return the build steps needed to bring an existing bundle up to the bundled assets."""
+        manifest = self._load_install_manifest(fgmod_path)
+        optiscaler = manifest.get("optiscaler") if isinstance(manifest.get("optiscaler"), dict) else {}
+        if (
+            not fgmod_path.is_dir()
+            or str(optiscaler.get("sha256") or "").lower() != OPTISCALER_ARCHIVE_ASSET["sha256"].lower()
+            or not (fgmod_path / "D3D12_Optiscaler").is_dir()
+            # The launcher_scripts step restores missing scripts without a full rebuild
+            or set(self._missing_bundle_files(fgmod_path)) - set(LAUNCHER_SCRIPTS.values())
+        ):
+            return list(BUNDLE_BUILD_STEPS)
+
+        steps: list[str] = []
+        proxy_sha256 = self._file_sha256(fgmod_path / "OptiScaler.dll")
+        if not all(self._file_has_sha256(fgmod_path / "renames" / name, proxy_sha256) for name in PROXY_DLL_BACKUPS):
+            steps.append("renames")
+        if not all(
+            self._files_match(assets_dir / script_name, fgmod_path / dest_name)
+            for script_name, dest_name in LAUNCHER_SCRIPTS.items()
+            if (assets_dir / script_name).exists()
+        ):
+            steps.append("launcher_scripts")
+        if (
+            self._read_json_file(fgmod_path / INI_RULES_FILENAME).get("rules") != OPTISCALER_INI_RULES
+            or self._read_json_file(fgmod_path / INI_KEY_INDEX_FILENAME).get("schema_version")
+            != INI_KEY_INDEX_SCHEMA_VERSION
+            or not (fgmod_path / INI_ENV_NAMES_FILENAME).is_file()
+        ):
+            steps.append("ini_rules")
+        if not self._file_has_sha256(fgmod_path / "plugins" / "OptiPatcher.asi", OPTIPATCHER_ASSET["sha256"]):
+            steps.append("optipatcher")
+        native_sha256 = FSR4_VARIANTS["rdna4-native"]["sha256"]
+        if not all(
+            self._file_has_sha256(self._fsr4_variant_path(fgmod_path, variant_id), native_sha256)
+            for variant_id in ("rdna4-native", "rdna34-official-411")
+        ):
+            steps.append("fsr4_native")
+        official_411_driver = self._fsr4_variant_extra_file_path(
+            fgmod_path, "rdna34-official-411", FSR4_DRIVER_OVERRIDE_FILENAME
+        )
+        if not self._file_has_sha256(official_411_driver, FSR4_OFFICIAL_411_ASSET["sha256"]):
+            steps.append("fsr4_official_411_driver")
+        if not self._file_has_sha256(self._fsr4_variant_path(fgmod_path, "rdna23-int8"), FSR4_VARIANTS["rdna23-int8"]["sha256"]):
+            steps.append("fsr4_int8")
+        return steps
+
+    def _build_bundle(self, extract_path: Path, steps: list[str], bin_path: Path, assets_dir: Path) -> None:
+        """Run the requested build steps against extract_path.
+
+        The archive step expects the OptiScaler archive to be unpacked into extract_path already.
+        """
+        self._set_progress_stage("build")
+        if "archive" in steps:
+            (extract_path / VERSION_FILENAME).write_text(OPTISCALER_ARCHIVE_ASSET["version"], encoding="utf-8")
+
+        if "renames" in steps:
+            if not self._create_renamed_copies(extract_path / "OptiScaler.dll", extract_path / "renames"):
+                raise RuntimeError("Failed to prepare renamed OptiScaler proxies.")
+
+        if "launcher_scripts" in steps:
+            if not self._copy_launcher_scripts(assets_dir, extract_path):
+                raise RuntimeError("Failed to copy launcher scripts.")
+
+        if "ini_rules" in steps:
+            # Rules are idempotent, so an upgrade re-runs the install stage over the live INI, which
+            # picks up added or changed install rules before the key index is built from it
+            if not self._transform_optiscaler_ini(extract_path / "OptiScaler.ini", "install"):
+                raise RuntimeError("Failed to apply OptiScaler.ini defaults.")
+            self._write_json_file(
+                extract_path / INI_RULES_FILENAME, {"schema_version": 1, "rules": OPTISCALER_INI_RULES}
+            )
+            key_index = self._build_ini_key_index(extract_path / "OptiScaler.ini")
+            self._write_json_file(extract_path / INI_KEY_INDEX_FILENAME, key_index)
+            optiscaler_ini.write_atomic(
+                extract_path / INI_ENV_NAMES_FILENAME,
+                [f"{name}\n" for name in sorted(optiscaler_ini.addressable_env_names(key_index))],
+            )
+
+        if "optipatcher" in steps:
+            plugins_dir = extract_path / "plugins"
+            plugins_dir.mkdir(parents=True, exist_ok=True)
+            self._copy_verified(
+                bin_path / OPTIPATCHER_ASSET["name"],
+                plugins_dir / "OptiPatcher.asi",
+                OPTIPATCHER_ASSET["sha256"],
+                "Bundled OptiPatcher plugin",
+            )
+
+        official_411_dir = self._fsr4_variant_dir(extract_path, "rdna34-official-411")
+        if "fsr4_native" in steps:
+            # Both native variant dirs share the archive-native upscaler's stored object
+            rdna4_dir = self._fsr4_variant_dir(extract_path, "rdna4-native")
+            rdna4_dir.mkdir(parents=True, exist_ok=True)
+            official_411_dir.mkdir(parents=True, exist_ok=True)
+            self._link_bundle_files(
+                extract_path,
+                extract_path / FSR4_UPSCALER_FILENAME,
+                [rdna4_dir / FSR4_UPSCALER_FILENAME, official_411_dir / FSR4_UPSCALER_FILENAME],
+                FSR4_VARIANTS["rdna4-native"]["sha256"],
+                "Archive-native FSR4 upscaler",
+            )
+
+        if "fsr4_official_411_driver" in steps:
+            official_411_dir.mkdir(parents=True, exist_ok=True)
+            self._copy_verified(
+                bin_path / FSR4_OFFICIAL_411_ASSET["name"],
+                official_411_dir / FSR4_DRIVER_OVERRIDE_FILENAME,
+                FSR4_OFFICIAL_411_ASSET["sha256"],
+                "Bundled rdna34-official-411 driver override",
+            )
+
+        if "fsr4_int8" in steps:
+            rdna23_dir = self._fsr4_variant_dir(extract_path, "rdna23-int8")
+            rdna23_dir.mkdir(parents=True, exist_ok=True)
+            self._copy_verified(
+                bin_path / FSR4_INT8_ASSET["name"],
+                rdna23_dir / FSR4_UPSCALER_FILENAME,
+                FSR4_VARIANTS["rdna23-int8"]["sha256"],
+                "Bundled rdna23-int8 FSR4 upscaler",
+            )
+
+    def _recover_interrupted_install(self, extract_path: Path) -> None:
+        """Clean up after an install that stopped before or during the bundle swap."""
+        staging_path = extract_path.with_name(BUNDLE_STAGING_DIRNAME)
+        previous_path = extract_path.with_name(BUNDLE_PREVIOUS_DIRNAME)
+        if staging_path.exists():
+            shutil.rmtree(staging_path, ignore_errors=True)
+            decky.logger.info(f"Removed stale bundle staging directory {staging_path}")
+        if previous_path.exists():
+            if not extract_path.exists():
+                os.rename(previous_path, extract_path)
+                decky.logger.info(f"Restored previous bundle from {previous_path}")
+            else:
+                shutil.rmtree(previous_path, ignore_errors=True)
+
+    def _stage_bundle(self, extract_path: Path, full: bool) -> Path:
+        """Create the staging directory, hardlink-cloning the live bundle for incremental builds."""
+        staging_path = extract_path.with_name(BUNDLE_STAGING_DIRNAME)
+        if staging_path.exists():
+            shutil.rmtree(staging_path)
+        if full or not extract_path.exists():
+            staging_path.mkdir(parents=True)
+        else:
+            # Build steps replace files via rename, so the shared inodes are never written through
+            shutil.copytree(extract_path, staging_path, symlinks=True, copy_function=self._link_keeping_digest)
+        return staging_path
+
+    def _exchange_paths(self, path_a: Path, path_b: Path) -> bool:
+        """Atomically swap two paths with renameat2(RENAME_EXCHANGE); False if unsupported."""
+        try:
+            renameat2 = ctypes.CDLL(None, use_errno=True).renameat2
+        except (OSError, AttributeError):
+            return False
+        at_fdcwd = -100
+        rename_exchange = 2
+        result = renameat2(at_fdcwd, os.fsencode(str(path_a)), at_fdcwd, os.fsencode(str(path_b)), rename_exchange)
+        return result == 0
+
+    def _publish_bundle(self, staging_path: Path, extract_path: Path) -> None:
+        """Swap a fully built staging directory into place, keeping the old bundle until it succeeds."""
+        for filename in BUNDLE_STATE_FILES:
+            state_file = extract_path / filename
+            if state_file.exists() and not (staging_path / filename).exists():
+                shutil.copy2(state_file, staging_path / filename)
+
+        if not extract_path.exists():
+            os.rename(staging_path, extract_path)
+        elif self._exchange_paths(staging_path, extract_path):
+            shutil.rmtree(staging_path, ignore_errors=True)
+        else:
+            previous_path = extract_path.with_name(BUNDLE_PREVIOUS_DIRNAME)
+            if previous_path.exists():
+                shutil.rmtree(previous_path)
+            os.rename(extract_path, previous_path)
+            try:
+                os.rename(staging_path, extract_path)
+            except Exception:
+                os.rename(previous_path, extract_path)
+                raise
+            shutil.rmtree(previous_path, ignore_errors=True)
+
+        with self._hash_cache_lock:
+            self._save_hash_cache()
+        with self._patched_index_lock:
+            if self._patched_index is not None:
+                self._save_patched_index()
+
+    def _build_install_manifest(self, extract_path: Path, selected_default_variant: str, previous: dict | None = None) -> dict:
+        now = datetime.now(timezone.utc).isoformat()
+        previous = previous or {}
+        manifest = {
+            "schema_version": 1,
+            "installed_at": previous.get("installed_at") or now,
+            "optiscaler": {
+                "asset_name": OPTISCALER_ARCHIVE_ASSET["name"],
+                "version": OPTISCALER_ARCHIVE_ASSET["version"],
+                "sha256": OPTISCALER_ARCHIVE_ASSET["sha256"],
+                "native_upscaler_sha256": FSR4_VARIANTS["rdna4-native"]["sha256"],
+            },
+            "optipatcher": {
+                "asset_name": OPTIPATCHER_ASSET["name"],
+                "version": OPTIPATCHER_ASSET["version"],
+                "sha256": OPTIPATCHER_ASSET["sha256"],
+                "target_path": str(Path("plugins") / "OptiPatcher.asi"),
+            },
+            "fsr4_variants": {
+                variant_id: {
+                    "label": variant["label"],
+                    "dir_name": variant["dir_name"],
+                    "path": str((Path(variant["dir_name"]) / FSR4_UPSCALER_FILENAME).as_posix()),
+                    "sha256": variant["sha256"],
+                    "source_asset_name": variant["source_asset_name"],
+                    "source_version": variant["source_version"],
+                    "uses_archive_native": bool(variant["uses_archive_native"]),
+                    "extra_files": [
+                        {
+                            "name": extra_file["name"],
+                            "sha256": extra_file["sha256"],
+                            "source_asset_name": extra_file["source_asset_name"],
+                            "source_version": extra_file["source_version"],
+                            "path": str((Path(variant["dir_name"]) / extra_file["name"]).as_posix()),
+                        }
+                        for extra_file in variant.get("extra_files", [])
+                    ],
+                }
+                for variant_id, variant in FSR4_VARIANTS.items()
+            },
+            "selected_default_variant": selected_default_variant,
+            "active_root_upscaler": {
+                "path": FSR4_UPSCALER_FILENAME,
+                "sha256": self._file_sha256(extract_path / FSR4_UPSCALER_FILENAME),
+                "variant": selected_default_variant,
+            },
+        }
+        if previous:
+            manifest["updated_at"] = now
+        return manifest
+
     def _install_manifest_path(self, fgmod_path: Path) -> Path:
         return fgmod_path / INSTALL_MANIFEST_FILENAME
 
@@ -348,11 +1657,14 @@ class Plugin:
             return variant
         return DEFAULT_FSR4_VARIANT
 
-    def _selected_fsr4_variant(self, fgmod_path: Path, requested_variant: str | None = None) -> str:
+    def _selected_fsr4_variant(
+        self, fgmod_path: Path, requested_variant: str | None = None, manifest: dict | None = None
+    ) -> str:
         normalized_requested = str(requested_variant or "").strip()
         if normalized_requested in FSR4_VARIANTS:
             return normalized_requested
-        manifest = self._load_install_manifest(fgmod_path)
+        if manifest is None:
+            manifest = self._load_install_manifest(fgmod_path)
         manifest_variant = str(manifest.get("selected_default_variant") or "").strip()
         if manifest_variant in FSR4_VARIANTS:
             return manifest_variant
@@ -386,14 +1698,20 @@ class Plugin:
             source_path = self._fsr4_variant_extra_file_path(fgmod_path, fsr4_variant, filename)
             if not source_path.exists():
                 raise FileNotFoundError(f"Prepared FSR4 variant extra file missing: {source_path}")
-            shutil.copy2(source_path, root_path)
+            expected_sha256 = selected_extra_files[filename]["sha256"]
+            if root_path.exists() and self._file_sha256(root_path).lower() == expected_sha256.lower():
+                continue
+            self._link_bundle_files(fgmod_path, source_path, [root_path], expected_sha256, f"FSR4 variant extra file {filename}")
 
     def _activate_default_fsr4_variant(self, fgmod_path: Path, fsr4_variant: str | None) -> str:
         variant_id = self._normalize_fsr4_variant(fsr4_variant)
         variant_path = self._fsr4_variant_path(fgmod_path, variant_id)
         if not variant_path.exists():
             raise FileNotFoundError(f"Prepared FSR4 variant missing: {variant_path}")
-        shutil.copy2(variant_path, fgmod_path / FSR4_UPSCALER_FILENAME)
+        root_upscaler = fgmod_path / FSR4_UPSCALER_FILENAME
+        expected_sha256 = FSR4_VARIANTS[variant_id]["sha256"]
+        if not root_upscaler.exists() or self._file_sha256(root_upscaler).lower() != expected_sha256.lower():
+            self._link_bundle_files(fgmod_path, variant_path, [root_upscaler], expected_sha256, f"FSR4 variant {variant_id}")
         self._sync_variant_root_extra_files(fgmod_path, variant_id)
         return variant_id
 
@@ -423,8 +1741,9 @@ class Plugin:
                 return variant_id
         return None
 
-    def _fgmod_version(self, fgmod_path: Path) -> str | None:
-        manifest = self._load_install_manifest(fgmod_path)
+    def _fgmod_version(self, fgmod_path: Path, manifest: dict | None = None) -> str | None:
+        if manifest is None:
+            manifest = self._load_install_manifest(fgmod_path)
         optiscaler = manifest.get("optiscaler") if isinstance(manifest, dict) else None
         if isinstance(optiscaler, dict) and optiscaler.get("version"):
             return str(optiscaler.get("version"))
@@ -465,107 +1784,61 @@ class Plugin:
                 return True
         return False
 
-    def _migrate_optiscaler_ini(self, ini_file):
-        """Migrate pre-v0.9-final OptiScaler.ini: replace FGType with FGInput + FGOutput.
+    def _build_ini_key_index(self, ini_file: Path) -> dict:
+        """Summarize which env var names can address the default INI, for the launcher's env filter."""
+        sections = optiscaler_ini.index_ini(optiscaler_ini.read_ini(ini_file))
+        return optiscaler_ini.build_key_index(sections, INI_KEY_INDEX_SCHEMA_VERSION)
 
-        v0.9-final split the single FGType key into separate FGInput and FGOutput keys.
-        Games already patched with an older build will have FGType=<value> in their
-        per-game INI but no FGInput/FGOutput entries, causing the new DLL to silently
-        fall back to nofg.  This migration runs at patch-time and at every fgmod.sh
-        launch so users never have to manually touch their INI.
-        """
-        try:
-            if not ini_file.exists():
-                return False
-
-            with open(ini_file, 'r') as f:
-                content = f.read()
-
-            fg_type_match = re.search(r'^FGType\s*=\s*(\S+)', content, re.MULTILINE)
-            if not fg_type_match:
-                return True  # Nothing to migrate
-
-            fg_value = fg_type_match.group(1)
-
-            if re.search(r'^FGInput\s*=', content, re.MULTILINE):
-                # FGInput already present (INI already in v0.9-final format);
-                # just remove the now-unknown FGType line.
-                content = re.sub(r'^FGType\s*=\s*\S+\n?', '', content, flags=re.MULTILINE)
-                decky.logger.info(f"Removed stale FGType from {ini_file} (FGInput already present)")
-            else:
-                # Replace the single FGType=X line with FGInput=X then FGOutput=X
-                content = re.sub(
-                    r'^FGType\s*=\s*\S+',
-                    f'FGInput={fg_value}\nFGOutput={fg_value}',
-                    content,
-                    flags=re.MULTILINE
-                )
-                decky.logger.info(f"Migrated FGType={fg_value} → FGInput={fg_value}, FGOutput={fg_value} in {ini_file}")
-
-            with open(ini_file, 'w') as f:
-                f.write(content)
-            return True
-        except Exception as e:
-            decky.logger.error(f"Failed to migrate OptiScaler.ini: {e}")
-            return False
-
-    def _disable_hq_font_auto(self, ini_file):
-        """Disable the new HQ font auto mode to avoid missing font assertions on Wine/Proton."""
+    def _transform_optiscaler_ini(self, ini_file: Path, stage: str) -> bool:
+        """Run the stage's INI rules with one read and, only when something changed, one atomic write."""
         try:
             if not ini_file.exists():
                 decky.logger.warning(f"OptiScaler.ini not found at {ini_file}")
                 return False
-
-            with open(ini_file, 'r') as f:
-                content = f.read()
-
-            updated_content = re.sub(r'UseHQFont\s*=\s*auto', 'UseHQFont=false', content)
-            if updated_content != content:
-                with open(ini_file, 'w') as f:
-                    f.write(updated_content)
-                decky.logger.info("Set UseHQFont=false to avoid missing font assertions")
-
+            lines = optiscaler_ini.read_ini(ini_file)
+            changes = optiscaler_ini.apply_rules(lines, OPTISCALER_INI_RULES, stage)
+            if changes:
+                optiscaler_ini.write_atomic(ini_file, lines)
+                decky.logger.info(f"Updated {ini_file} for {stage}: {'; '.join(changes)}")
             return True
         except Exception as e:
-            decky.logger.error(f"Failed to update HQ font setting in OptiScaler.ini: {e}")
+            decky.logger.error(f"Failed to update OptiScaler.ini at {ini_file}: {e}")
             return False
 
-    def _modify_optiscaler_ini(self, ini_file):
-        """Modify OptiScaler.ini to set FG defaults, ASI plugin settings, and safe font defaults."""
-        try:
-            if ini_file.exists():
-                with open(ini_file, 'r') as f:
-                    content = f.read()
-                
-                # Replace FGInput=auto with FGInput=nukems (final v0.9+ split FGType into FGInput/FGOutput)
-                updated_content = re.sub(r'FGInput\s*=\s*auto', 'FGInput=nukems', content)
-
-                # Replace FGOutput=auto with FGOutput=nukems
-                updated_content = re.sub(r'FGOutput\s*=\s*auto', 'FGOutput=nukems', updated_content)
-                
-                # Replace Fsr4Update=auto with Fsr4Update=true
-                updated_content = re.sub(r'Fsr4Update\s*=\s*auto', 'Fsr4Update=true', updated_content)
-                
-                # Replace LoadAsiPlugins=auto with LoadAsiPlugins=true
-                updated_content = re.sub(r'LoadAsiPlugins\s*=\s*auto', 'LoadAsiPlugins=true', updated_content)
-
-                # Disable new HQ font auto mode to avoid missing font assertions on Proton
-                updated_content = re.sub(r'UseHQFont\s*=\s*auto', 'UseHQFont=false', updated_content)
-                
-                with open(ini_file, 'w') as f:
-                    f.write(updated_content)
-                
-                decky.logger.info("Modified OptiScaler.ini to set FGInput=nukems, FGOutput=nukems, Fsr4Update=true, LoadAsiPlugins=true, UseHQFont=false")
-                return True
-            else:
-                decky.logger.warning(f"OptiScaler.ini not found at {ini_file}")
-                return False
-        except Exception as e:
-            decky.logger.error(f"Failed to modify OptiScaler.ini: {e}")
-            return False
-
-    async def extract_static_optiscaler(self, selected_default_variant: str = DEFAULT_FSR4_VARIANT) -> dict:
+    def _finish_bundle(
+        self,
+        staging_path: Path,
+        extract_path: Path,
+        steps: list[str],
+        bin_path: Path,
+        assets_dir: Path,
+        selected_default_variant: str,
+        previous_manifest: dict,
+    ) -> str:
+        """Complete a staged bundle and swap it in; returns the default variant actually activated."""
+        self._build_bundle(staging_path, steps, bin_path, assets_dir)
+        selected_default_variant = self._activate_default_fsr4_variant(staging_path, selected_default_variant)
+        self._set_progress_stage("dedupe")
+        self._dedupe_bundle(staging_path)
+        install_manifest = self._build_install_manifest(staging_path, selected_default_variant, previous_manifest)
+        self._write_json_file(self._install_manifest_path(staging_path), install_manifest)
+        self._set_progress_stage("publish")
+        self._publish_bundle(staging_path, extract_path)
+        return selected_default_variant
+
+    async def extract_static_optiscaler(
+        self,
+        selected_default_variant: str = DEFAULT_FSR4_VARIANT,
+        io_policy: str = DEFAULT_IO_POLICY,
+    ) -> dict:
         """Prepare the shared ~/fgmod bundle with all bundled FSR4 runtime variants."""
+        with self._io_policy(io_policy):
+            try:
+                return await self._extract_static_optiscaler(selected_default_variant)
+            finally:
+                await self._run_blocking(self._flush_hash_cache)
+
+    async def _extract_static_optiscaler(self, selected_default_variant: str) -> dict:
         try:
             decky.logger.info("Starting extract_static_optiscaler method")
 
@@ -582,149 +1855,88 @@ class Plugin:
             fsr4_official_411_src = bin_path / FSR4_OFFICIAL_411_ASSET["name"]
             optipatcher_src = bin_path / OPTIPATCHER_ASSET["name"]
             for required_path, asset in [
-                (optiscaler_archive, OPTISCALER_ARCHIVE_ASSET),
-                (fsr4_int8_src, FSR4_INT8_ASSET),
-                (fsr4_official_411_src, FSR4_OFFICIAL_411_ASSET),
-                (optipatcher_src, OPTIPATCHER_ASSET),
-            ]:
-                if not required_path.exists():
-                    return {
-                        "status": "error",
-                        "message": f"Required bundled asset missing: {asset['name']}",
-                    }
-                self._verify_bundled_asset(required_path, asset["sha256"], asset["name"])
-
-            if extract_path.exists():
-                shutil.rmtree(extract_path)
-            extract_path.mkdir(parents=True, exist_ok=True)
-
-            self._extract_archive(optiscaler_archive, extract_path)
-
-            source_file = extract_path / "OptiScaler.dll"
-            renames_dir = extract_path / "renames"
-            if not self._create_renamed_copies(source_file, renames_dir):
-                return {"status": "error", "message": "Failed to prepare renamed OptiScaler proxies."}
-
-            if not self._copy_launcher_scripts(assets_dir, extract_path):
-                return {"status": "error", "message": "Failed to copy launcher scripts."}
-
-            plugins_dir = extract_path / "plugins"
-            plugins_dir.mkdir(parents=True, exist_ok=True)
-            optipatcher_dst = plugins_dir / "OptiPatcher.asi"
-            shutil.copy2(optipatcher_src, optipatcher_dst)
-            optipatcher_sha256 = self._verify_bundled_asset(
-                optipatcher_dst,
-                OPTIPATCHER_ASSET["sha256"],
-                "Prepared OptiPatcher plugin",
-            )
-
-            ini_file = extract_path / "OptiScaler.ini"
-            self._modify_optiscaler_ini(ini_file)
-
-            native_upscaler_root = extract_path / FSR4_UPSCALER_FILENAME
-            native_upscaler_sha256 = self._verify_bundled_asset(
-                native_upscaler_root,
-                FSR4_VARIANTS["rdna4-native"]["sha256"],
-                "Archive-native FSR4 upscaler",
-            )
-
-            rdna4_dir = extract_path / FSR4_VARIANTS["rdna4-native"]["dir_name"]
-            rdna4_dir.mkdir(parents=True, exist_ok=True)
-            rdna4_upscaler = rdna4_dir / FSR4_UPSCALER_FILENAME
-            shutil.copy2(native_upscaler_root, rdna4_upscaler)
-            self._verify_bundled_asset(
-                rdna4_upscaler,
-                FSR4_VARIANTS["rdna4-native"]["sha256"],
-                "Prepared rdna4-native FSR4 upscaler",
-            )
-
-            official_411_dir = extract_path / FSR4_VARIANTS["rdna34-official-411"]["dir_name"]
-            official_411_dir.mkdir(parents=True, exist_ok=True)
-            official_411_upscaler = official_411_dir / FSR4_UPSCALER_FILENAME
-            shutil.copy2(native_upscaler_root, official_411_upscaler)
-            self._verify_bundled_asset(
-                official_411_upscaler,
-                FSR4_VARIANTS["rdna34-official-411"]["sha256"],
-                "Prepared rdna34-official-411 FSR4 upscaler",
-            )
-            self._verify_bundled_asset(
-                fsr4_official_411_src,
-                FSR4_OFFICIAL_411_ASSET["sha256"],
-                "Bundled rdna34-official-411 driver override",
-            )
-            official_411_driver = official_411_dir / FSR4_DRIVER_OVERRIDE_FILENAME
-            shutil.copy2(fsr4_official_411_src, official_411_driver)
-            self._verify_bundled_asset(
-                official_411_driver,
-                FSR4_OFFICIAL_411_ASSET["sha256"],
-                "Prepared rdna34-official-411 driver override",
-            )
+                (optiscaler_archive, OPTISCALER_ARCHIVE_ASSET),
+                (fsr4_int8_src, FSR4_INT8_ASSET),
+                (fsr4_official_411_src, FSR4_OFFICIAL_411_ASSET),
+                (optipatcher_src, OPTIPATCHER_ASSET),
+            ]:
+                if not required_path.exists():
+                    return {
+                        "status": "error",
+                        "message": f"Required bundled asset missing: {asset['name']}",
+                    }
 
-            rdna23_dir = extract_path / FSR4_VARIANTS["rdna23-int8"]["dir_name"]
-            rdna23_dir.mkdir(parents=True, exist_ok=True)
-            self._verify_bundled_asset(
-                fsr4_int8_src,
-                FSR4_VARIANTS["rdna23-int8"]["sha256"],
-                "Bundled rdna23-int8 FSR4 upscaler",
-            )
-            shutil.copy2(fsr4_int8_src, rdna23_dir / FSR4_UPSCALER_FILENAME)
-            self._verify_bundled_asset(
-                rdna23_dir / FSR4_UPSCALER_FILENAME,
-                FSR4_VARIANTS["rdna23-int8"]["sha256"],
-                "Prepared rdna23-int8 FSR4 upscaler",
+            await self._run_blocking(self._recover_interrupted_install, extract_path)
+            steps = await self._run_blocking(self._bundle_upgrade_plan, extract_path, assets_dir)
+            previous_manifest = self._load_install_manifest(extract_path) if "archive" not in steps else {}
+            root_variant_current = previous_manifest.get("selected_default_variant") == selected_default_variant and (
+                await self._run_blocking(
+                    self._file_has_sha256,
+                    extract_path / FSR4_UPSCALER_FILENAME,
+                    FSR4_VARIANTS[selected_default_variant]["sha256"],
+                )
             )
+            if not steps and root_variant_current:
+                decky.logger.info("OptiScaler bundle already matches the bundled assets; nothing to do")
+                return {
+                    "status": "success",
+                    "message": f"OptiScaler {OPTISCALER_ARCHIVE_ASSET['version']} is already up to date in ~/fgmod",
+                    "version": OPTISCALER_ARCHIVE_ASSET["version"],
+                    "selected_default_variant": selected_default_variant,
+                    "selected_default_variant_label": FSR4_VARIANTS[selected_default_variant]["label"],
+                }
 
-            selected_default_variant = self._activate_default_fsr4_variant(extract_path, selected_default_variant)
-            active_upscaler_sha256 = self._file_sha256(extract_path / FSR4_UPSCALER_FILENAME)
+            full_build = "archive" in steps
+            # Progress is measured in bytes read from the bundled assets this build uses
+            step_assets = {
+                "archive": optiscaler_archive,
+                "optipatcher": optipatcher_src,
+                "fsr4_official_411_driver": fsr4_official_411_src,
+                "fsr4_int8": fsr4_int8_src,
+            }
+            bytes_total = sum(path.stat().st_size for step, path in step_assets.items() if step in steps)
+            if full_build:
+                # The archive is read twice: once to verify it, once by 7z
+                bytes_total += optiscaler_archive.stat().st_size
+            progress_id = self._begin_progress("install", bytes_total)
+            progress_token = self._progress_context.set(progress_id)
 
-            version_file = extract_path / VERSION_FILENAME
-            version_file.write_text(OPTISCALER_ARCHIVE_ASSET["version"], encoding="utf-8")
+            try:
+                if full_build:
+                    # The loose assets are verified inline while they are copied into the bundle
+                    self._set_progress_stage("verify")
+                    await self._run_blocking(
+                        self._verify_bundled_asset,
+                        optiscaler_archive,
+                        OPTISCALER_ARCHIVE_ASSET["sha256"],
+                        OPTISCALER_ARCHIVE_ASSET["name"],
+                    )
+                    self._advance_progress(optiscaler_archive.stat().st_size)
+                    decky.logger.info("Performing full OptiScaler bundle extraction")
+                else:
+                    decky.logger.info(f"Incremental OptiScaler bundle upgrade: {steps or ['default variant']}")
 
-            install_manifest = {
-                "schema_version": 1,
-                "installed_at": datetime.now(timezone.utc).isoformat(),
-                "optiscaler": {
-                    "asset_name": OPTISCALER_ARCHIVE_ASSET["name"],
-                    "version": OPTISCALER_ARCHIVE_ASSET["version"],
-                    "sha256": OPTISCALER_ARCHIVE_ASSET["sha256"],
-                    "native_upscaler_sha256": native_upscaler_sha256,
-                },
-                "optipatcher": {
-                    "asset_name": OPTIPATCHER_ASSET["name"],
-                    "version": OPTIPATCHER_ASSET["version"],
-                    "sha256": optipatcher_sha256,
-                    "target_path": str(optipatcher_dst.relative_to(extract_path)),
-                },
-                "fsr4_variants": {
-                    variant_id: {
-                        "label": variant["label"],
-                        "dir_name": variant["dir_name"],
-                        "path": str((Path(variant["dir_name"]) / FSR4_UPSCALER_FILENAME).as_posix()),
-                        "sha256": variant["sha256"],
-                        "source_asset_name": variant["source_asset_name"],
-                        "source_version": variant["source_version"],
-                        "uses_archive_native": bool(variant["uses_archive_native"]),
-                        "extra_files": [
-                            {
-                                "name": extra_file["name"],
-                                "sha256": extra_file["sha256"],
-                                "source_asset_name": extra_file["source_asset_name"],
-                                "source_version": extra_file["source_version"],
-                                "path": str((Path(variant["dir_name"]) / extra_file["name"]).as_posix()),
-                            }
-                            for extra_file in variant.get("extra_files", [])
-                        ],
-                    }
-                    for variant_id, variant in FSR4_VARIANTS.items()
-                },
-                "selected_default_variant": selected_default_variant,
-                "active_root_upscaler": {
-                    "path": FSR4_UPSCALER_FILENAME,
-                    "sha256": active_upscaler_sha256,
-                    "variant": selected_default_variant,
-                },
-            }
-            self._write_json_file(self._install_manifest_path(extract_path), install_manifest)
+                # Build next to the live bundle and swap it in only once the manifest is written
+                self._set_progress_stage("stage")
+                staging_path = await self._run_blocking(self._stage_bundle, extract_path, full_build)
+                try:
+                    if full_build:
+                        self._set_progress_stage("extract")
+                        await self._extract_archive(optiscaler_archive, staging_path)
+                    selected_default_variant = await self._run_blocking(
+                        self._finish_bundle, staging_path, extract_path, steps, bin_path, assets_dir,
+                        selected_default_variant, previous_manifest,
+                    )
+                except Exception:
+                    shutil.rmtree(staging_path, ignore_errors=True)
+                    raise
+                await self._run_blocking(self._prune_bundle_objects, extract_path)
+            except Exception:
+                self._end_progress(progress_id, "error")
+                raise
+            finally:
+                self._progress_context.reset(progress_token)
+            self._end_progress(progress_id, "done")
 
             return {
                 "status": "success",
@@ -739,13 +1951,23 @@ class Plugin:
             decky.logger.error(f"Traceback: {traceback.format_exc()}")
             return {"status": "error", "message": f"Extract failed: {str(e)}"}
 
-    async def run_uninstall_fgmod(self) -> dict:
+    def _remove_bundle_dirs(self, fgmod_path: Path) -> bool:
+        """Delete ~/fgmod and any staging/previous leftovers; False if there was no bundle."""
+        for leftover in (BUNDLE_STAGING_DIRNAME, BUNDLE_PREVIOUS_DIRNAME):
+            shutil.rmtree(fgmod_path.with_name(leftover), ignore_errors=True)
+        if not fgmod_path.exists():
+            return False
+        shutil.rmtree(fgmod_path)
+        return True
+
+    async def run_uninstall_fgmod(self, io_policy: str = DEFAULT_IO_POLICY) -> dict:
         try:
             # Remove fgmod directory
             fgmod_path = Path(decky.HOME) / "fgmod"
+            with self._io_policy(io_policy):
+                removed = await self._run_blocking(self._remove_bundle_dirs, fgmod_path)
             
-            if fgmod_path.exists():
-                shutil.rmtree(fgmod_path)
+            if removed:
                 decky.logger.info(f"Removed directory: {fgmod_path}")
                 return {
                     "status": "success", 
@@ -765,7 +1987,7 @@ class Plugin:
                 "output": str(e)
             }
 
-    async def set_default_fsr4_variant(self, selected_default_variant: str = DEFAULT_FSR4_VARIANT) -> dict:
+    def _set_default_fsr4_variant(self, selected_default_variant: str = DEFAULT_FSR4_VARIANT) -> dict:
         try:
             fgmod_path = Path(decky.HOME) / "fgmod"
             if not fgmod_path.exists():
@@ -797,12 +2019,27 @@ class Plugin:
             decky.logger.error(f"Failed to switch default FSR4 runtime: {e}")
             return {"status": "error", "message": f"Failed to switch default FSR4 runtime: {e}"}
 
-    async def run_install_fgmod(self, selected_default_variant: str = DEFAULT_FSR4_VARIANT) -> dict:
+    async def set_default_fsr4_variant(
+        self,
+        selected_default_variant: str = DEFAULT_FSR4_VARIANT,
+        io_policy: str = DEFAULT_IO_POLICY,
+    ) -> dict:
+        with self._io_policy(io_policy):
+            try:
+                return await self._run_blocking(self._set_default_fsr4_variant, selected_default_variant)
+            finally:
+                await self._run_blocking(self._flush_hash_cache)
+
+    async def run_install_fgmod(
+        self,
+        selected_default_variant: str = DEFAULT_FSR4_VARIANT,
+        io_policy: str = DEFAULT_IO_POLICY,
+    ) -> dict:
         try:
             decky.logger.info("Starting OptiScaler installation from static bundle")
             selected_default_variant = self._normalize_fsr4_variant(selected_default_variant)
 
-            extract_result = await self.extract_static_optiscaler(selected_default_variant)
+            extract_result = await self.extract_static_optiscaler(selected_default_variant, io_policy)
             if extract_result["status"] != "success":
                 return {
                     "status": "error",
@@ -832,56 +2069,7 @@ class Plugin:
             }
 
     async def check_fgmod_path(self) -> dict:
-        path = Path(decky.HOME) / "fgmod"
-        required_files = [
-            "OptiScaler.dll",
-            "OptiScaler.ini",
-            "dlssg_to_fsr3_amd_is_better.dll",
-            "fakenvapi.dll",
-            "fakenvapi.ini",
-            "amd_fidelityfx_dx12.dll",
-            "amd_fidelityfx_framegeneration_dx12.dll",
-            FSR4_UPSCALER_FILENAME,
-            "amd_fidelityfx_vk.dll",
-            "libxess.dll",
-            "libxess_dx11.dll",
-            "libxess_fg.dll",
-            "libxell.dll",
-            "fgmod",
-            "fgmod-uninstaller.sh",
-            "update-optiscaler-config.py",
-            INSTALL_MANIFEST_FILENAME,
-        ]
-
-        if not path.exists():
-            return {"exists": False}
-
-        for file_name in required_files:
-            if not path.joinpath(file_name).exists():
-                return {"exists": False}
-
-        plugins_dir = path / "plugins"
-        if not plugins_dir.exists() or not (plugins_dir / "OptiPatcher.asi").exists():
-            return {"exists": False}
-
-        for variant in FSR4_VARIANTS.values():
-            variant_dir = path / variant["dir_name"]
-            variant_path = variant_dir / FSR4_UPSCALER_FILENAME
-            if not variant_path.exists():
-                return {"exists": False}
-            for extra_file in variant.get("extra_files", []):
-                if not (variant_dir / extra_file["name"]).exists():
-                    return {"exists": False}
-
-        manifest = self._load_install_manifest(path)
-        selected_variant = self._selected_fsr4_variant(path)
-        return {
-            "exists": True,
-            "version": self._fgmod_version(path),
-            "selected_fsr4_variant": selected_variant,
-            "selected_fsr4_variant_label": FSR4_VARIANTS[selected_variant]["label"],
-            "install_manifest_present": bool(manifest),
-        }
+        return await self._run_blocking(self._bundle_status)
 
     def _resolve_target_directory(self, directory: str) -> Path:
         decky.logger.info(f"Resolving target directory: {directory}")
@@ -909,8 +2097,9 @@ class Plugin:
                 "message": "OptiScaler bundle not installed. Run Install first.",
             }
 
+        bundle = self._directory_entries(fgmod_path)
         optiscaler_dll = fgmod_path / "OptiScaler.dll"
-        if not optiscaler_dll.exists():
+        if "OptiScaler.dll" not in bundle:
             return {
                 "status": "error",
                 "message": "OptiScaler.dll not found in ~/fgmod. Reinstall OptiScaler.",
@@ -936,19 +2125,57 @@ class Plugin:
                 f"Manual patch started for {directory} with FSR4 variant {selected_variant} ({selected_variant_info['label']})"
             )
 
-            backed_up_proxies = self._backup_preexisting_proxy_files(directory, fgmod_path)
+            self._set_progress_stage("backup")
+            # Every backup, cleanup and restore decision below runs against this one snapshot,
+            # updated in place as files move, instead of stat-ing each candidate name
+            present = self._directory_entries(directory)
+            already_patched = allow_managed_support_cleanup or self._has_patch_fingerprint(present)
+            backed_up_proxies = self._backup_preexisting_proxy_files(directory, fgmod_path, present)
             decky.logger.info(
                 f"Backed up pre-existing proxy files: {backed_up_proxies}"
                 if backed_up_proxies
                 else "No pre-existing proxy files required backup"
             )
 
+            # Plan the deployment up front so files that already match the bundle are left alone
+            renamed = fgmod_path / "renames" / dll_name
+            source_for_copy = renamed if renamed.exists() else optiscaler_dll
+            planned: dict[str, Path] = {dll_name: source_for_copy}
+            missing_support = []
+            for filename in SUPPORT_FILES:
+                if filename in bundle:
+                    planned[filename] = fgmod_path / filename
+                else:
+                    missing_support.append(filename)
+            planned[FSR4_UPSCALER_FILENAME] = selected_upscaler_src
+            for extra_file in selected_extra_files:
+                source = self._fsr4_variant_extra_file_path(fgmod_path, selected_variant, extra_file["name"])
+                if source.exists():
+                    planned[extra_file["name"]] = source
+                else:
+                    missing_support.append(extra_file["name"])
+            for tree_name in ("plugins", "D3D12_Optiscaler"):
+                if tree_name in bundle:
+                    planned.update(self._tree_files(fgmod_path / tree_name, tree_name))
+                else:
+                    decky.logger.warning(f"{tree_name} directory missing in fgmod bundle")
+            unchanged = {
+                name
+                for name, source in planned.items()
+                if name.split("/", 1)[0] in present and self._deployed_file_current(source, directory / name)
+            }
+            if not already_patched:
+                # A game can ship a DLL identical to ours; on a first patch it is still the game's
+                # file, so back it up and redeploy instead of adopting it as managed
+                unchanged.difference_update(ORIGINAL_DLL_BACKUPS, PATCH_CLEANUP_FILES)
+
             removed_patch_files = []
             for filename in dict.fromkeys(PATCH_CLEANUP_FILES):
-                path = directory / filename
-                if path.exists():
-                    path.unlink()
-                    removed_patch_files.append(filename)
+                if filename in unchanged or filename not in present:
+                    continue
+                (directory / filename).unlink()
+                present.discard(filename)
+                removed_patch_files.append(filename)
             decky.logger.info(
                 f"Removed stale patch files: {removed_patch_files}"
                 if removed_patch_files
@@ -958,15 +2185,16 @@ class Plugin:
             backed_up_originals = []
             removed_managed_support = []
             for dll in ORIGINAL_DLL_BACKUPS:
-                source = directory / dll
-                backup = directory / f"{dll}.b"
-                if not source.exists() or backup.exists():
+                if dll in unchanged or dll not in present or f"{dll}.b" in present:
                     continue
+                source = directory / dll
+                present.discard(dll)
                 if allow_managed_support_cleanup and self._is_managed_support_file(source, fgmod_path):
                     source.unlink()
                     removed_managed_support.append(dll)
                     continue
-                shutil.move(source, backup)
+                shutil.move(source, directory / f"{dll}.b")
+                present.add(f"{dll}.b")
                 backed_up_originals.append(dll)
             if removed_managed_support:
                 decky.logger.info(f"Removed managed support files before repatch: {removed_managed_support}")
@@ -976,70 +2204,50 @@ class Plugin:
                 else "No original game DLLs required backup"
             )
 
-            renamed = fgmod_path / "renames" / dll_name
-            destination_dll = directory / dll_name
-            source_for_copy = renamed if renamed.exists() else optiscaler_dll
-            shutil.copy2(source_for_copy, destination_dll)
-            decky.logger.info(f"Copied injector DLL from {source_for_copy} to {destination_dll}")
-
+            self._set_progress_stage(
+                "deploy",
+                bytes_total=sum(source.stat().st_size for name, source in planned.items() if name not in unchanged),
+            )
+            deployed: dict[str, str] = {}
+            copied_support = []
+            for name, source in planned.items():
+                dest = directory / name
+                if name in unchanged:
+                    deployed[name] = "hardlink" if os.path.samefile(source, dest) else "unchanged"
+                    continue
+                dest.parent.mkdir(parents=True, exist_ok=True)
+                deployed[name] = self._deploy_file(source, dest)
+                if deployed[name] != "copy":
+                    # Copies report their bytes as they stream; clones and links complete at once
+                    self._advance_progress(source.stat().st_size)
+                if name != dll_name and "/" not in name:
+                    copied_support.append(name)
+            present.update(name.split("/", 1)[0] for name in planned)
+            decky.logger.info(f"Injector DLL {dll_name} from {source_for_copy}: {deployed[dll_name]}")
+            if unchanged:
+                decky.logger.info(f"Left {len(unchanged)} files that already match the bundle in place")
+
+            self._set_progress_stage("ini")
             target_ini = directory / "OptiScaler.ini"
             source_ini = fgmod_path / "OptiScaler.ini"
-            if preserve_ini and target_ini.exists():
+            if preserve_ini and "OptiScaler.ini" in present:
                 decky.logger.info(f"Preserving existing OptiScaler.ini at {target_ini}")
-            elif source_ini.exists():
-                shutil.copy2(source_ini, target_ini)
+            elif "OptiScaler.ini" in bundle:
+                deployed["OptiScaler.ini"] = self._deploy_file(source_ini, target_ini)
+                present.add("OptiScaler.ini")
                 decky.logger.info(f"Copied OptiScaler.ini from {source_ini} to {target_ini}")
             else:
                 decky.logger.warning("No OptiScaler.ini found to copy")
 
-            if target_ini.exists():
-                self._migrate_optiscaler_ini(target_ini)
-                self._disable_hq_font_auto(target_ini)
-
-            plugins_src = fgmod_path / "plugins"
-            plugins_dest = directory / "plugins"
-            if plugins_src.exists():
-                shutil.copytree(plugins_src, plugins_dest, dirs_exist_ok=True)
-                decky.logger.info(f"Synced plugins directory from {plugins_src} to {plugins_dest}")
-            else:
-                decky.logger.warning("Plugins directory missing in fgmod bundle")
-
-            d3d12_src = fgmod_path / "D3D12_Optiscaler"
-            d3d12_dest = directory / "D3D12_Optiscaler"
-            if d3d12_src.exists():
-                shutil.copytree(d3d12_src, d3d12_dest, dirs_exist_ok=True)
-                decky.logger.info(f"Copied D3D12_Optiscaler directory to {d3d12_dest}")
-            else:
-                decky.logger.warning("D3D12_Optiscaler directory missing in fgmod bundle")
-
-            copied_support = []
-            missing_support = []
-            for filename in SUPPORT_FILES:
-                source = fgmod_path / filename
-                dest = directory / filename
-                if source.exists():
-                    shutil.copy2(source, dest)
-                    copied_support.append(filename)
-                else:
-                    missing_support.append(filename)
-
-            upscaler_dest = directory / FSR4_UPSCALER_FILENAME
-            shutil.copy2(selected_upscaler_src, upscaler_dest)
-            copied_support.append(FSR4_UPSCALER_FILENAME)
-
-            for extra_file in selected_extra_files:
-                source = self._fsr4_variant_extra_file_path(fgmod_path, selected_variant, extra_file["name"])
-                dest = directory / extra_file["name"]
-                if source.exists():
-                    shutil.copy2(source, dest)
-                    copied_support.append(extra_file["name"])
-                else:
-                    missing_support.append(extra_file["name"])
+            if "OptiScaler.ini" in present:
+                self._transform_optiscaler_ini(target_ini, "patch")
 
             if copied_support:
                 decky.logger.info(f"Copied support files: {copied_support}")
             if missing_support:
                 decky.logger.warning(f"Support files missing from fgmod bundle: {missing_support}")
+            deployment = self._summarize_deployment(deployed)
+            decky.logger.info(f"Deployment strategy: {deployment['strategy']} ({deployment['counts']})")
 
             decky.logger.info(f"Manual patch complete for {directory}")
             return {
@@ -1052,6 +2260,8 @@ class Plugin:
                 "fsr4_variant_label": selected_variant_info["label"],
                 "fsr4_upscaler_sha256": selected_upscaler_sha256,
                 "optiscaler_version": optiscaler_version,
+                "deployment": deployment,
+                "backed_up_files": [dll for dll in dict.fromkeys(RESTORABLE_BACKUP_FILES) if f"{dll}.b" in present],
             }
 
         except PermissionError as exc:
@@ -1067,52 +2277,66 @@ class Plugin:
                 "message": f"Manual patch failed: {exc}",
             }
 
+    def _summarize_deployment(self, deployed: dict[str, str]) -> dict:
+        counts: dict[str, int] = {}
+        for method in deployed.values():
+            counts[method] = counts.get(method, 0) + 1
+        strategy = next(iter(counts)) if len(counts) == 1 else ("mixed" if counts else "none")
+        return {"strategy": strategy, "counts": counts, "files": deployed}
+
     def _manual_unpatch_directory_impl(self, directory: Path) -> dict:
         try:
             decky.logger.info(f"Manual unpatch started for {directory}")
 
+            present = self._directory_entries(directory)
+
             removed_files = []
-            for filename in set(INJECTOR_FILENAMES + SUPPORT_FILES + VARIANT_EXTRA_FILENAMES + [FSR4_UPSCALER_FILENAME]):
-                path = directory / filename
-                if path.exists():
-                    path.unlink()
-                    removed_files.append(filename)
+            for filename in present.intersection(
+                INJECTOR_FILENAMES + SUPPORT_FILES + VARIANT_EXTRA_FILENAMES + [FSR4_UPSCALER_FILENAME]
+            ):
+                (directory / filename).unlink()
+                removed_files.append(filename)
+            present.difference_update(removed_files)
             decky.logger.info(f"Removed injector/support files: {removed_files}" if removed_files else "No injector/support files found to remove")
 
             legacy_removed = []
-            for legacy in LEGACY_FILES:
+            for legacy in dict.fromkeys(LEGACY_FILES):
+                if legacy not in present:
+                    continue
                 path = directory / legacy
-                if path.exists():
-                    try:
-                        path.unlink()
-                    except IsADirectoryError:
-                        shutil.rmtree(path, ignore_errors=True)
-                    legacy_removed.append(legacy)
+                try:
+                    path.unlink()
+                except IsADirectoryError:
+                    shutil.rmtree(path, ignore_errors=True)
+                present.discard(legacy)
+                legacy_removed.append(legacy)
             decky.logger.info(f"Removed legacy artifacts: {legacy_removed}" if legacy_removed else "No legacy artifacts present")
 
             plugins_dir = directory / "plugins"
-            if plugins_dir.exists():
+            if "plugins" in present:
                 shutil.rmtree(plugins_dir, ignore_errors=True)
                 decky.logger.info(f"Removed plugins directory at {plugins_dir}")
 
             d3d12_dir = directory / "D3D12_Optiscaler"
-            if d3d12_dir.exists():
+            if "D3D12_Optiscaler" in present:
                 shutil.rmtree(d3d12_dir, ignore_errors=True)
                 decky.logger.info(f"Removed D3D12_Optiscaler directory from {d3d12_dir}")
 
             restored_backups = []
             for dll in dict.fromkeys(RESTORABLE_BACKUP_FILES):
-                backup = directory / f"{dll}.b"
+                if f"{dll}.b" not in present:
+                    continue
                 original = directory / dll
-                if backup.exists():
-                    if original.exists():
-                        original.unlink()
-                    shutil.move(backup, original)
-                    restored_backups.append(dll)
+                if dll in present:
+                    original.unlink()
+                shutil.move(directory / f"{dll}.b", original)
+                present.discard(f"{dll}.b")
+                present.add(dll)
+                restored_backups.append(dll)
             decky.logger.info(f"Restored backups: {restored_backups}" if restored_backups else "No backups found to restore")
 
             uninstaller = directory / "fgmod-uninstaller.sh"
-            if uninstaller.exists():
+            if "fgmod-uninstaller.sh" in present:
                 uninstaller.unlink()
                 decky.logger.info(f"Removed fgmod uninstaller at {uninstaller}")
 
@@ -1161,6 +2385,69 @@ class Plugin:
                 seen.add(key)
         return unique
 
+    def _vdf_tokens(self, lines):
+        """Yield ("{" | "}" | "str", value) tokens from an iterable of VDF text lines."""
+        pending = ""
+        for line in lines:
+            if pending:
+                line = pending + line
+                pending = ""
+            for match in VDF_TOKEN_RE.finditer(line):
+                quoted, brace, unterminated, word = match.groups()
+                if brace:
+                    yield brace, brace
+                elif unterminated is not None:
+                    # Quoted values may contain newlines; join with the following line
+                    pending = unterminated
+                elif quoted is not None:
+                    if "\\" in quoted:
+                        quoted = re.sub(r"\\(.)", lambda m: VDF_ESCAPES.get(m.group(1), m.group(0)), quoted, flags=re.S)
+                    yield "str", quoted
+                elif word is not None:
+                    # Conditionals such as [$WIN32] annotate the previous pair and are not keys
+                    if not (word.startswith("[") and word.endswith("]")):
+                        yield "str", word
+
+    def _parse_vdf(self, lines, stop_keys: set[str] | None = None) -> dict:
+        """Parse VDF into nested dicts; with stop_keys, stop once the root object holds them all.
+
+        Keys are kept as written, the first occurrence of a duplicate scalar wins and stop_keys
+        are matched case-insensitively against keys directly inside the root object.
+        """
+        root: dict = {}
+        stack = [root]
+        key = None
+        remaining = set(stop_keys) if stop_keys else None
+        for kind, value in self._vdf_tokens(lines):
+            if kind == "{":
+                child = stack[-1].get(key) if key is not None else None
+                if not isinstance(child, dict):
+                    child = {}
+                    if key is not None:
+                        stack[-1][key] = child
+                stack.append(child)
+                key = None
+            elif kind == "}":
+                if len(stack) > 1:
+                    stack.pop()
+                key = None
+            elif key is None:
+                key = value
+            else:
+                stack[-1].setdefault(key, value)
+                if remaining is not None and len(stack) == 2:
+                    remaining.discard(key.lower())
+                    if not remaining:
+                        break
+                key = None
+        return root
+
+    def _vdf_root_object(self, data: dict) -> dict:
+        for value in data.values():
+            if isinstance(value, dict):
+                return value
+        return {}
+
     def _steam_library_paths(self) -> list[Path]:
         library_paths: list[Path] = []
         seen: set[str] = set()
@@ -1175,56 +2462,235 @@ class Plugin:
                 continue
             try:
                 with open(library_file, "r", encoding="utf-8", errors="replace") as f:
-                    for line in f:
-                        if '"path"' not in line:
-                            continue
-                        path = line.split('"path"', 1)[1].strip().strip('"').replace("\\\\", "/")
-                        candidate = Path(path)
-                        key = str(candidate)
-                        if key not in seen:
-                            library_paths.append(candidate)
-                            seen.add(key)
+                    folders = self._vdf_root_object(self._parse_vdf(f))
             except Exception as exc:
                 decky.logger.error(f"[Framegen] failed to parse libraryfolders: {library_file}: {exc}")
+                continue
+            for folder_id, folder in folders.items():
+                if isinstance(folder, dict):
+                    path = folder.get("path")
+                elif folder_id.isdigit():
+                    # Pre-2021 Steam stored each library as a bare "<index>" "<path>" pair
+                    path = folder
+                else:
+                    continue
+                if not path:
+                    continue
+                candidate = Path(path.replace("\\", "/"))
+                key = str(candidate)
+                if key not in seen:
+                    library_paths.append(candidate)
+                    seen.add(key)
         return library_paths
 
-    def _find_installed_games(self, appid: str | None = None) -> list[dict]:
-        games: list[dict] = []
-        for library_path in self._steam_library_paths():
-            steamapps_path = library_path / "steamapps"
-            if not steamapps_path.exists():
+    def _parse_app_manifest(self, appmanifest: Path, library_path: Path) -> dict | None:
+        try:
+            with open(appmanifest, "r", encoding="utf-8", errors="replace") as f:
+                app_state = self._vdf_root_object(self._parse_vdf(f, APP_MANIFEST_KEYS))
+        except Exception as exc:
+            decky.logger.error(f"[Framegen] skipping manifest {appmanifest}: {exc}")
+            return None
+        # Only top-level AppState keys count; nested depot and config blocks reuse names like "name"
+        fields = {
+            key.lower(): value.strip()
+            for key, value in app_state.items()
+            if isinstance(value, str) and key.lower() in APP_MANIFEST_KEYS
+        }
+        game_info: dict = {
+            "appid": fields.get("appid", ""),
+            "name": fields.get("name", ""),
+            "library_path": str(library_path),
+            "install_path": "",
+            "buildid": fields.get("buildid", ""),
+            "size_on_disk": int(fields["sizeondisk"]) if fields.get("sizeondisk", "").isdigit() else 0,
+            "state_flags": int(fields["stateflags"]) if fields.get("stateflags", "").isdigit() else 0,
+        }
+        if not game_info["appid"] or not game_info["name"]:
+            return None
+        if "Proton" in game_info["name"] or "Steam Linux Runtime" in game_info["name"]:
+            return None
+        install_dir = fields.get("installdir", "")
+        install_path = appmanifest.parent / "common" / install_dir if install_dir else Path()
+        game_info["install_path"] = str(install_path)
+        return game_info
+
+    def _mtime_ns(self, path: Path) -> int | None:
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+
+    def _refresh_library(self, library_path: Path, previous: dict | None) -> dict | None:
+        """Re-read one library's manifests, reusing every record whose file is unchanged."""
+        steamapps_path = library_path / "steamapps"
+        dir_mtime = self._mtime_ns(steamapps_path)
+        if dir_mtime is None:
+            return None
+        previous_manifests = previous["manifests"] if previous else {}
+        if previous and previous["mtime_ns"] == dir_mtime:
+            # No manifest was added, removed or renamed into place; only in-place edits remain
+            names = list(previous_manifests)
+        else:
+            try:
+                with os.scandir(steamapps_path) as entries:
+                    names = [
+                        entry.name
+                        for entry in entries
+                        if entry.name.startswith("appmanifest_") and entry.name.endswith(".acf")
+                    ]
+            except OSError as exc:
+                decky.logger.error(f"[Framegen] failed to list {steamapps_path}: {exc}")
+                return None
+        manifests: dict[str, dict] = {}
+        for name in names:
+            appmanifest = steamapps_path / name
+            try:
+                signature = self._stat_signature(os.stat(appmanifest))
+            except OSError:
                 continue
-            for appmanifest in steamapps_path.glob("appmanifest_*.acf"):
-                game_info: dict = {"appid": "", "name": "", "library_path": str(library_path), "install_path": ""}
-                install_dir = ""
-                try:
-                    with open(appmanifest, "r", encoding="utf-8", errors="replace") as f:
-                        for line in f:
-                            if '"appid"' in line:
-                                game_info["appid"] = line.split('"appid"', 1)[1].strip().strip('"')
-                            elif '"name"' in line:
-                                game_info["name"] = line.split('"name"', 1)[1].strip().strip('"')
-                            elif '"installdir"' in line:
-                                install_dir = line.split('"installdir"', 1)[1].strip().strip('"')
-                except Exception as exc:
-                    decky.logger.error(f"[Framegen] skipping manifest {appmanifest}: {exc}")
-                    continue
-                if not game_info["appid"] or not game_info["name"]:
+            cached = previous_manifests.get(name)
+            if cached and cached["signature"] == signature:
+                manifests[name] = cached
+            else:
+                manifests[name] = {"signature": signature, "record": self._parse_app_manifest(appmanifest, library_path)}
+        return {"mtime_ns": dir_mtime, "manifests": manifests}
+
+    def _installed_games_by_appid(self, force: bool = False) -> dict[str, dict]:
+        with self._game_registry_lock:
+            registry = self._game_registry
+            now = time.monotonic()
+            if registry and not force:
+                # With every steamapps directory watched, manifest events keep the registry current
+                if self._registry_watched or now - registry["checked_at"] < GAME_REGISTRY_TTL_SECONDS:
+                    return registry["games"]
+
+            library_files = {
+                str(root): self._mtime_ns(root / "steamapps" / "libraryfolders.vdf")
+                for root in self._steam_root_candidates()
+            }
+            roots_present = {str(root): root.exists() for root in self._steam_root_candidates()}
+            if registry and registry["library_files"] == library_files and registry["roots_present"] == roots_present:
+                library_paths = registry["library_paths"]
+            else:
+                library_paths = self._steam_library_paths()
+
+            previous_libraries = registry["libraries"] if registry else {}
+            libraries, stale_libraries = self._scan_libraries(library_paths, previous_libraries)
+            if stale_libraries:
+                decky.logger.warning(f"[Framegen] serving cached games for slow libraries: {sorted(stale_libraries)}")
+            games = self._games_from_libraries(libraries)
+
+            self._game_registry = {
+                "checked_at": now,
+                "library_files": library_files,
+                "roots_present": roots_present,
+                "library_paths": library_paths,
+                "libraries": libraries,
+                "stale_libraries": stale_libraries,
+                "games": games,
+            }
+            return games
+
+    def _games_from_libraries(self, libraries: dict) -> dict[str, dict]:
+        games: dict[str, dict] = {}
+        for library in libraries.values():
+            for manifest in library["manifests"].values():
+                record = manifest["record"]
+                if record:
+                    games[str(record["appid"])] = record
+        return games
+
+    def _apply_manifest_changes(self, changes: dict[str, set[str]]) -> bool:
+        """Re-read only the appmanifests inotify reported; returns whether the game table changed."""
+        with self._game_registry_lock:
+            registry = self._game_registry
+            if registry is None:
+                return False
+            libraries = dict(registry["libraries"])
+            for key, names in changes.items():
+                library = libraries.get(key)
+                if library is None:
                     continue
-                if "Proton" in game_info["name"] or "Steam Linux Runtime" in game_info["name"]:
+                library_path = Path(key)
+                steamapps_path = library_path / "steamapps"
+                manifests = dict(library["manifests"])
+                for name in names:
+                    appmanifest = steamapps_path / name
+                    try:
+                        signature = self._stat_signature(os.stat(appmanifest))
+                    except OSError:
+                        manifests.pop(name, None)
+                        continue
+                    cached = manifests.get(name)
+                    if not cached or cached["signature"] != signature:
+                        manifests[name] = {
+                            "signature": signature,
+                            "record": self._parse_app_manifest(appmanifest, library_path),
+                        }
+                libraries[key] = {"mtime_ns": self._mtime_ns(steamapps_path), "manifests": manifests}
+            games = self._games_from_libraries(libraries)
+            changed = games != registry["games"]
+            self._game_registry = {
+                **registry,
+                "checked_at": time.monotonic(),
+                "libraries": libraries,
+                "games": games,
+            }
+            return changed
+
+    def _scan_libraries(self, library_paths: list[Path], previous_libraries: dict) -> tuple[dict, set[str]]:
+        """Refresh all libraries concurrently; one that is unreachable or misses the deadline keeps its last result."""
+        if self._library_scan_pool is None:
+            self._library_scan_pool = ThreadPoolExecutor(
+                max_workers=LIBRARY_SCAN_MAX_WORKERS, thread_name_prefix="framegen-library"
+            )
+        scans = {}
+        submitted = []
+        for library_path in library_paths:
+            key = str(library_path)
+            previous = previous_libraries.get(key)
+            in_flight = self._library_scans.pop(key, None)
+            if in_flight is not None:
+                if not in_flight.done():
+                    # Still blocked on the device; queuing another scan would only pile up stuck threads
+                    scans[key] = in_flight
                     continue
-                install_path = steamapps_path / "common" / install_dir if install_dir else Path()
-                game_info["install_path"] = str(install_path)
-                if appid is None or str(game_info["appid"]) == str(appid):
-                    games.append(game_info)
-        deduped: dict[str, dict] = {}
-        for game in games:
-            deduped[str(game["appid"])] = game
-        return sorted(deduped.values(), key=lambda g: g["name"].lower())
+                if in_flight.exception() is None and in_flight.result() is not None:
+                    previous = in_flight.result()
+            scans[key] = self._library_scan_pool.submit(self._refresh_library, library_path, previous)
+            submitted.append(scans[key])
+
+        # Only new scans get the deadline; a library already known to hang is not waited on again
+        if submitted:
+            wait_futures(submitted, timeout=LIBRARY_SCAN_TIMEOUT_SECONDS)
+
+        libraries: dict[str, dict] = {}
+        stale_libraries: set[str] = set()
+        for key, future in scans.items():
+            library = None
+            if not future.done():
+                self._library_scans[key] = future
+            elif future.exception() is not None:
+                decky.logger.error(f"[Framegen] library scan failed for {key}: {future.exception()}")
+            else:
+                library = future.result()
+            if library is not None:
+                libraries[key] = library
+            elif key in previous_libraries:
+                libraries[key] = previous_libraries[key]
+                stale_libraries.add(key)
+        return libraries, stale_libraries
+
+    def _is_library_stale(self, game_info: dict) -> bool:
+        """True when the game's library did not answer the last scan, so its install must not be touched."""
+        registry = self._game_registry
+        return bool(registry) and game_info.get("library_path") in registry["stale_libraries"]
+
+    def _find_installed_games(self) -> list[dict]:
+        return sorted(self._installed_games_by_appid().values(), key=lambda g: g["name"].lower())
 
     def _game_record(self, appid: str) -> dict | None:
-        matches = self._find_installed_games(appid)
-        return matches[0] if matches else None
+        return self._installed_games_by_appid().get(str(appid))
 
     # ── Patch target auto-detection ───────────────────────────────────────────
 
@@ -1234,16 +2700,46 @@ class Plugin:
         normalized = normalized.replace("//", "/")
         return normalized
 
-    def _candidate_executables(self, install_root: Path) -> list[Path]:
+    def _is_pruned_exe_dir(self, name: str, parent_name: str) -> bool:
+        if name in EXE_SCAN_PRUNED_DIRS:
+            return True
+        return name == "paks" and parent_name == "content"
+
+    def _scan_executables(self, install_root: Path) -> list[Path]:
+        """Depth-limited scandir walk for *.exe that skips redistributables, media and packed content."""
+        candidates: list[Path] = []
+        pending: list[tuple[str, int]] = [(str(install_root), 0)]
+        while pending:
+            directory, depth = pending.pop()
+            parent_name = os.path.basename(directory).lower()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        name = entry.name.lower()
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                if depth < EXE_SCAN_MAX_DEPTH and not self._is_pruned_exe_dir(name, parent_name):
+                                    pending.append((entry.path, depth + 1))
+                            elif name.endswith(".exe") and entry.is_file():
+                                candidates.append(Path(entry.path))
+                        except OSError:
+                            continue
+            except OSError as exc:
+                decky.logger.error(f"[Framegen] exe scan failed for {directory}: {exc}")
+        return candidates
+
+    def _candidate_executables(self, game_info: dict) -> list[Path]:
+        install_root = Path(game_info["install_path"])
         if not install_root.exists():
             return []
-        candidates: list[Path] = []
-        try:
-            for exe in install_root.rglob("*.exe"):
-                if exe.is_file():
-                    candidates.append(exe)
-        except Exception as exc:
-            decky.logger.error(f"[Framegen] exe scan failed for {install_root}: {exc}")
+        appid = str(game_info.get("appid") or install_root)
+        # Steam bumps buildid on every update; fall back to the root's mtime for manifests without one
+        build_key = f"{install_root}|{game_info.get('buildid') or self._mtime_ns(install_root)}"
+        cached = self._exe_candidates_cache.get(appid)
+        if cached and cached["key"] == build_key:
+            return [Path(path) for path in cached["candidates"]]
+        candidates = self._scan_executables(install_root)
+        self._exe_candidates_cache[appid] = {"key": build_key, "candidates": [str(exe) for exe in candidates]}
         return candidates
 
     def _exe_score(self, exe: Path, install_root: Path, game_name: str) -> int:
@@ -1273,30 +2769,89 @@ class Plugin:
         score -= len(exe.parts)
         return score
 
-    def _best_running_executable(self, candidates: list[Path]) -> Path | None:
-        if not candidates:
-            return None
+    def _scan_processes(self) -> dict:
+        """Read every process's cmdline and environ once from /proc.
+
+        Launch helpers are ignored, and an appid only counts as running while a Windows process
+        (a .exe run by Wine) carries it, so wineserver or fossilize lingering after exit do not.
+        """
+        appids: set[str] = set()
+        exe_paths: set[str] = set()
         try:
-            result = subprocess.run(["ps", "-eo", "args="], capture_output=True, text=True, check=False)
-            process_lines = result.stdout.splitlines()
-        except Exception as exc:
+            pids = [name for name in os.listdir("/proc") if name.isdigit()]
+        except OSError as exc:
             decky.logger.error(f"[Framegen] running exe scan failed: {exc}")
+            pids = []
+        for pid in pids:
+            try:
+                with open(f"/proc/{pid}/cmdline", "rb") as f:
+                    cmdline = f.read()
+            except OSError:
+                continue
+            program = self._normalized_path_string(
+                cmdline.split(b"\0", 1)[0].decode("utf-8", "replace")
+            )
+            if program.rsplit("/", 1)[-1] in LAUNCH_HELPER_PROCESSES:
+                continue
+            exe_paths.update(self._cmdline_exe_paths(cmdline))
+            if not program.endswith(".exe") or any(system in program for system in WINE_SYSTEM_DIRS):
+                continue
+            try:
+                with open(f"/proc/{pid}/environ", "rb") as f:
+                    environ = f.read()
+            except OSError:
+                continue
+            for variable in environ.split(b"\0"):
+                name, _, value = variable.partition(b"=")
+                if name in STEAM_APPID_ENV_VARS and value and value != b"0":
+                    appids.add(value.decode("utf-8", "replace"))
+        return {"taken_at": time.monotonic(), "appids": appids, "exe_paths": exe_paths}
+
+    def _cmdline_exe_paths(self, cmdline: bytes) -> set[str]:
+        """Normalized paths ending in .exe anywhere in a NUL-separated cmdline.
+
+        An argument can carry the exe mid-string (Wine's "Game.exe -arg" or --exe=...\\Game.exe),
+        so every .exe boundary yields a path, indexed by each /-anchored tail so absolute
+        candidate paths still match by set lookup whatever precedes them.
+        """
+        paths: set[str] = set()
+        for arg in cmdline.split(b"\0"):
+            lowered = arg.lower()
+            end = lowered.find(b".exe")
+            while end != -1:
+                path = self._normalized_path_string(arg[: end + 4].decode("utf-8", "replace"))
+                start = path.find("/")
+                while start != -1:
+                    paths.add(path[start:])
+                    start = path.find("/", start + 1)
+                end = lowered.find(b".exe", end + 4)
+        return paths
+
+    def _process_snapshot(self) -> dict:
+        """Return a /proc snapshot shared by all running-game checks within a short window."""
+        with self._process_snapshot_lock:
+            snapshot = self._process_snapshot_cache
+            if snapshot is None or time.monotonic() - snapshot["taken_at"] > PROCESS_SNAPSHOT_TTL_SECONDS:
+                snapshot = self._scan_processes()
+                self._process_snapshot_cache = snapshot
+            return snapshot
+
+    def _best_running_executable(self, candidates: list[Path]) -> Path | None:
+        if not candidates:
             return None
-        normalized_candidates = [(exe, self._normalized_path_string(str(exe))) for exe in candidates]
+        exe_paths = self._process_snapshot()["exe_paths"]
         matches: list[tuple[int, Path]] = []
-        for line in process_lines:
-            normalized_line = self._normalized_path_string(line)
-            for exe, normalized_exe in normalized_candidates:
-                if normalized_exe in normalized_line:
-                    matches.append((len(normalized_exe), exe))
+        for exe in candidates:
+            normalized_exe = self._normalized_path_string(str(exe))
+            if normalized_exe in exe_paths:
+                matches.append((len(normalized_exe), exe))
         if not matches:
             return None
-        matches.sort(key=lambda item: item[0], reverse=True)
-        return matches[0][1]
+        return max(matches, key=lambda item: item[0])[1]
 
     def _guess_patch_target(self, game_info: dict) -> tuple[Path, Path | None]:
         install_root = Path(game_info["install_path"])
-        candidates = self._candidate_executables(install_root)
+        candidates = self._candidate_executables(game_info)
         if not candidates:
             return install_root, None
         running_exe = self._best_running_executable(candidates)
@@ -1306,12 +2861,90 @@ class Plugin:
         return best.parent, best
 
     def _is_game_running(self, game_info: dict) -> bool:
-        install_root = Path(game_info["install_path"])
-        candidates = self._candidate_executables(install_root)
+        if str(game_info.get("appid")) in self._process_snapshot()["appids"]:
+            return True
+        candidates = self._candidate_executables(game_info)
         return self._best_running_executable(candidates) is not None
 
     # ── Marker file tracking ──────────────────────────────────────────────────
 
+    def _patched_index_path(self) -> Path:
+        return Path(decky.HOME) / "fgmod" / PATCHED_GAMES_FILENAME
+
+    def _load_patched_index(self) -> dict:
+        """Return the appid -> marker index, rebuilding it with a one-time tree scan when the file is missing.
+
+        Call without _patched_index_lock held and take the lock to read or change the returned dict.
+        The scan runs outside the lock, so a rebuild on the idle-priority warm-up worker never makes
+        an interactive lookup wait; a caller that finds no index yet scans at its own priority.
+        """
+        with self._patched_index_lock:
+            if self._patched_index is not None:
+                return self._patched_index
+            index_path = self._patched_index_path()
+            if index_path.exists():
+                games = self._read_json_file(index_path).get("games")
+                self._patched_index = games if isinstance(games, dict) else {}
+                return self._patched_index
+
+        decky.logger.info("[Framegen] patched-games index missing, scanning installed games for markers")
+        games = {}
+        for appid, game_info in self._installed_games_by_appid().items():
+            marker = self._find_marker(Path(game_info["install_path"]))
+            if marker:
+                metadata = self._read_marker(marker)
+                games[appid] = {
+                    "marker_path": str(marker),
+                    "target_dir": str(metadata.get("target_dir", str(marker.parent))),
+                }
+        with self._patched_index_lock:
+            # Concurrent rebuilds scan the same trees; the first to finish is kept
+            if self._patched_index is None:
+                self._patched_index = games
+                self._save_patched_index()
+            return self._patched_index
+
+    def _save_patched_index(self) -> None:
+        index_path = self._patched_index_path()
+        if not index_path.parent.is_dir():
+            return
+        try:
+            self._write_json_file(index_path, {"schema_version": 1, "games": self._patched_index or {}})
+        except Exception as exc:
+            decky.logger.warning(f"Failed to persist patched-games index: {exc}")
+
+    def _record_patched_game(self, appid: str, marker_path: Path, target_dir: Path) -> None:
+        patched_index = self._load_patched_index()
+        with self._patched_index_lock:
+            patched_index[str(appid)] = {"marker_path": str(marker_path), "target_dir": str(target_dir)}
+            self._save_patched_index()
+
+    def _forget_patched_game(self, appid: str) -> None:
+        patched_index = self._load_patched_index()
+        with self._patched_index_lock:
+            if patched_index.pop(str(appid), None) is not None:
+                self._save_patched_index()
+
+    def _marker_for_game(self, appid: str, install_root: Path) -> Path | None:
+        """Look a game's marker up in the patched-games index; only a stale entry triggers a tree scan."""
+        patched_index = self._load_patched_index()
+        with self._patched_index_lock:
+            entry = patched_index.get(str(appid))
+        if not entry:
+            return None
+        marker = Path(entry["marker_path"])
+        if marker.is_file():
+            return marker
+
+        # The indexed marker went away (game moved or verified); repair this one entry
+        marker = self._find_marker(install_root)
+        if marker:
+            metadata = self._read_marker(marker)
+            self._record_patched_game(appid, marker, Path(metadata.get("target_dir", str(marker.parent))))
+        else:
+            self._forget_patched_game(appid)
+        return marker
+
     def _find_marker(self, install_root: Path) -> Path | None:
         if not install_root.exists():
             return None
@@ -1392,21 +3025,26 @@ class Plugin:
             return True
         return False
 
-    async def list_installed_games(self) -> dict:
+    def _list_installed_games(self) -> dict:
         try:
             games = []
             for game in self._find_installed_games():
-                install_root = Path(game["install_path"])
+                library_stale = self._is_library_stale(game)
                 games.append({
                     "appid": str(game["appid"]),
                     "name": game["name"],
-                    "install_found": install_root.exists(),
+                    # Statting into a library that missed its scan deadline would block on the same device
+                    "install_found": not library_stale and Path(game["install_path"]).exists(),
+                    "library_stale": library_stale,
                 })
             return {"status": "success", "games": games}
         except Exception as e:
             decky.logger.error(str(e))
             return {"status": "error", "message": str(e)}
 
+    async def list_installed_games(self) -> dict:
+        return await self._run_blocking(self._list_installed_games)
+
     async def get_path_defaults(self) -> dict:
         try:
             home_path = Path(decky.HOME)
@@ -1428,6 +3066,7 @@ class Plugin:
         directory: str,
         dll_name: str = "dxgi.dll",
         fsr4_variant: str = DEFAULT_FSR4_VARIANT,
+        io_policy: str = DEFAULT_IO_POLICY,
     ) -> dict:
         if dll_name not in VALID_DLL_NAMES:
             return {"status": "error", "message": f"Invalid proxy DLL name: {dll_name}"}
@@ -1438,27 +3077,35 @@ class Plugin:
             return {"status": "error", "message": str(exc)}
 
         allow_managed_support_cleanup = (target_dir / MARKER_FILENAME).exists()
-        return self._manual_patch_directory_impl(
-            target_dir,
-            dll_name,
-            fsr4_variant,
-            allow_managed_support_cleanup=allow_managed_support_cleanup,
-        )
+        with self._io_policy(io_policy):
+            return await self._run_tracked(
+                "patch",
+                self._manual_patch_directory_impl,
+                target_dir,
+                dll_name,
+                fsr4_variant,
+                allow_managed_support_cleanup=allow_managed_support_cleanup,
+            )
 
-    async def manual_unpatch_directory(self, directory: str) -> dict:
+    async def manual_unpatch_directory(self, directory: str, io_policy: str = DEFAULT_IO_POLICY) -> dict:
         try:
             target_dir = self._resolve_target_directory(directory)
         except (FileNotFoundError, NotADirectoryError, PermissionError) as exc:
             decky.logger.error(f"Manual unpatch validation failed: {exc}")
             return {"status": "error", "message": str(exc)}
 
-        return self._manual_unpatch_directory_impl(target_dir)
+        with self._io_policy(io_policy):
+            return await self._run_tracked("unpatch", self._manual_unpatch_directory_impl, target_dir)
 
     # ── AppID-based patch / unpatch / status ───────────────────────────────────────
 
-    async def get_game_status(self, appid: str) -> dict:
+    def _game_status(
+        self,
+        appid: str,
+        game_info: dict | None,
+        marker_lookup: dict[str, Path | None] | None = None,
+    ) -> dict:
         try:
-            game_info = self._game_record(str(appid))
             if not game_info:
                 return {
                     "status": "success",
@@ -1471,6 +3118,19 @@ class Plugin:
                     "fsr4_variant_label": None,
                     "message": "Game not found in Steam library.",
                 }
+            if self._is_library_stale(game_info):
+                return {
+                    "status": "success",
+                    "appid": str(appid),
+                    "name": game_info["name"],
+                    "install_found": False,
+                    "patched": False,
+                    "dll_name": None,
+                    "target_dir": None,
+                    "fsr4_variant": None,
+                    "fsr4_variant_label": None,
+                    "message": "Steam library is unavailable or not responding.",
+                }
             install_root = Path(game_info["install_path"])
             if not install_root.exists():
                 return {
@@ -1485,7 +3145,10 @@ class Plugin:
                     "fsr4_variant_label": None,
                     "message": "Game install directory not found.",
                 }
-            marker = self._find_marker(install_root)
+            if marker_lookup is not None and str(appid) in marker_lookup:
+                marker = marker_lookup[str(appid)]
+            else:
+                marker = self._marker_for_game(appid, install_root)
             if not marker:
                 return {
                     "status": "success",
@@ -1532,7 +3195,60 @@ class Plugin:
             decky.logger.error(f"[Framegen] get_game_status failed for {appid}: {exc}")
             return {"status": "error", "message": str(exc)}
 
-    async def patch_game(
+    def _games_status(self, appids: list[str] | None) -> dict[str, dict]:
+        """Build statuses for many games with one library scan, one marker pass and one hash pass."""
+        games = self._installed_games_by_appid()
+        wanted = [str(appid) for appid in appids] if appids is not None else list(games)
+        installed = [
+            appid for appid in wanted
+            if appid in games
+            and not self._is_library_stale(games[appid])
+            and Path(games[appid]["install_path"]).exists()
+        ]
+        if self._status_pool is None:
+            self._status_pool = ThreadPoolExecutor(
+                max_workers=GAME_STATUS_MAX_WORKERS, thread_name_prefix="framegen-status"
+            )
+        pool = self._status_pool
+        found = pool.map(
+            lambda appid: self._marker_for_game(appid, Path(games[appid]["install_path"])), installed
+        )
+        markers: dict[str, Path | None] = dict(zip(installed, found))
+
+        # Hash every managed FSR4 file up front so the per-game pass below only hits the cache
+        hash_targets: list[Path] = []
+        for marker in markers.values():
+            if not marker:
+                continue
+            target_dir = Path(self._read_marker(marker).get("target_dir", str(marker.parent)))
+            for filename in (FSR4_UPSCALER_FILENAME, *VARIANT_EXTRA_FILENAMES):
+                if (target_dir / filename).is_file():
+                    hash_targets.append(target_dir / filename)
+        list(pool.map(self._file_sha256, hash_targets))
+        self._flush_hash_cache()
+
+        statuses = pool.map(lambda appid: self._game_status(appid, games.get(appid), markers), wanted)
+        return dict(zip(wanted, statuses))
+
+    async def get_game_status(self, appid: str) -> dict:
+        try:
+            return await self._run_blocking(lambda: self._game_status(str(appid), self._game_record(str(appid))))
+        finally:
+            await self._run_blocking(self._flush_hash_cache)
+
+    async def get_games_status(self, appids: list[str] | str = "all") -> dict:
+        if appids != "all" and not (
+            isinstance(appids, list) and all(isinstance(appid, str) for appid in appids)
+        ):
+            return {"status": "error", "message": 'appids must be "all" or a list of appid strings'}
+        try:
+            statuses = await self._run_blocking(self._games_status, None if appids == "all" else appids)
+            return {"status": "success", "games": statuses}
+        except Exception as exc:
+            decky.logger.error(f"[Framegen] get_games_status failed: {exc}")
+            return {"status": "error", "message": str(exc)}
+
+    def _patch_game(
         self,
         appid: str,
         dll_name: str = "dxgi.dll",
@@ -1556,7 +3272,7 @@ class Plugin:
 
             # Preserve true original launch options across re-patches
             original_launch_options = current_launch_options or ""
-            existing_marker = self._find_marker(install_root)
+            existing_marker = self._marker_for_game(str(appid), install_root)
             existing_marker_metadata = self._read_marker(existing_marker) if existing_marker else {}
             existing_marker_target_dir = Path(
                 existing_marker_metadata.get("target_dir", str(existing_marker.parent))
@@ -1584,7 +3300,7 @@ class Plugin:
             if result["status"] != "success":
                 return result
 
-            backed_up = [dll for dll in dict.fromkeys(RESTORABLE_BACKUP_FILES) if (target_dir / f"{dll}.b").exists()]
+            backed_up = result["backed_up_files"]
             marker_path = target_dir / MARKER_FILENAME
             self._write_marker(
                 marker_path,
@@ -1598,6 +3314,7 @@ class Plugin:
                 fsr4_variant=result.get("fsr4_variant"),
                 fsr4_upscaler_sha256=result.get("fsr4_upscaler_sha256"),
             )
+            self._record_patched_game(str(appid), marker_path, target_dir)
 
             if existing_marker and existing_marker != marker_path:
                 try:
@@ -1628,7 +3345,20 @@ class Plugin:
             decky.logger.error(f"[Framegen] patch_game failed for {appid}: {exc}")
             return {"status": "error", "message": str(exc)}
 
-    async def unpatch_game(self, appid: str) -> dict:
+    async def patch_game(
+        self,
+        appid: str,
+        dll_name: str = "dxgi.dll",
+        current_launch_options: str = "",
+        fsr4_variant: str = DEFAULT_FSR4_VARIANT,
+        io_policy: str = DEFAULT_IO_POLICY,
+    ) -> dict:
+        with self._io_policy(io_policy):
+            return await self._run_tracked(
+                "patch", self._patch_game, appid, dll_name, current_launch_options, fsr4_variant
+            )
+
+    def _unpatch_game(self, appid: str) -> dict:
         try:
             game_info = self._game_record(str(appid))
             if not game_info:
@@ -1644,7 +3374,7 @@ class Plugin:
                 }
             if self._is_game_running(game_info):
                 return {"status": "error", "message": "Close the game before unpatching."}
-            marker = self._find_marker(install_root)
+            marker = self._marker_for_game(str(appid), install_root)
             if not marker:
                 return {
                     "status": "success",
@@ -1661,6 +3391,7 @@ class Plugin:
                 marker.unlink()
             except FileNotFoundError:
                 pass
+            self._forget_patched_game(str(appid))
             decky.logger.info(f"[Framegen] unpatch_game success: appid={appid} target={target_dir}")
             return {
                 "status": "success",
@@ -1672,3 +3403,124 @@ class Plugin:
         except Exception as exc:
             decky.logger.error(f"[Framegen] unpatch_game failed for {appid}: {exc}")
             return {"status": "error", "message": str(exc)}
+
+    async def unpatch_game(self, appid: str, io_policy: str = DEFAULT_IO_POLICY) -> dict:
+        with self._io_policy(io_policy):
+            return await self._run_tracked("unpatch", self._unpatch_game, appid)
+
+    # ── Per-game OptiScaler.ini ───────────────────────────────────────────────
+
+    def _load_ini_model(self, ini_path: Path) -> dict:
+        """Return the parsed INI for ini_path, re-reading it only when its stat signature changed."""
+        signature = self._stat_signature(os.stat(ini_path))
+        with self._ini_models_lock:
+            model = self._ini_models.get(str(ini_path))
+        if model and model["signature"] == signature:
+            return model
+        lines = optiscaler_ini.read_ini(ini_path)
+        model = {"signature": signature, "lines": lines, "sections": optiscaler_ini.index_ini(lines)}
+        with self._ini_models_lock:
+            self._ini_models[str(ini_path)] = model
+        return model
+
+    def _game_ini_path(self, appid: str) -> Path:
+        game_info = self._game_record(str(appid))
+        if not game_info:
+            raise FileNotFoundError("Game not found in Steam library.")
+        marker = self._marker_for_game(str(appid), Path(game_info["install_path"]))
+        if not marker:
+            raise FileNotFoundError(f"{game_info['name']} is not patched.")
+        target_dir = Path(self._read_marker(marker).get("target_dir", str(marker.parent)))
+        ini_path = target_dir / "OptiScaler.ini"
+        if not ini_path.is_file():
+            raise FileNotFoundError(f"OptiScaler.ini not found in {target_dir}")
+        return ini_path
+
+    def _ini_model_sections(self, model: dict) -> list[dict]:
+        lines = model["lines"]
+        sections = []
+        for section, keys in model["sections"].items():
+            entries = []
+            for key, index in keys.items():
+                # OptiScaler documents each key in the ; comment lines directly above it
+                comment_lines = []
+                above = index - 1
+                while above >= 0 and lines[above].lstrip().startswith(";"):
+                    comment_lines.insert(0, lines[above].strip().lstrip(";").strip())
+                    above -= 1
+                entries.append({
+                    "key": key,
+                    "value": lines[index].rstrip("\r\n").split("=", 1)[1].strip(),
+                    "comment": "\n".join(comment_lines),
+                })
+            sections.append({"name": section, "keys": entries})
+        return sections
+
+    def _get_game_ini(self, appid: str) -> dict:
+        try:
+            ini_path = self._game_ini_path(appid)
+            model = self._load_ini_model(ini_path)
+            return {
+                "status": "success",
+                "appid": str(appid),
+                "path": str(ini_path),
+                "sections": self._ini_model_sections(model),
+            }
+        except FileNotFoundError as exc:
+            return {"status": "error", "message": str(exc)}
+        except Exception as exc:
+            decky.logger.error(f"[Framegen] get_game_ini failed for {appid}: {exc}")
+            return {"status": "error", "message": str(exc)}
+
+    def _update_game_ini(self, appid: str, updates: dict) -> dict:
+        """Apply {section: {key: value}} to a game's OptiScaler.ini as a single atomic write."""
+        try:
+            ini_path = self._game_ini_path(appid)
+            with self._ini_models_lock:
+                return self._write_game_ini(str(appid), ini_path, updates)
+        except FileNotFoundError as exc:
+            return {"status": "error", "message": str(exc)}
+        except Exception as exc:
+            decky.logger.error(f"[Framegen] update_game_ini failed for {appid}: {exc}")
+            return {"status": "error", "message": str(exc)}
+
+    def _write_game_ini(self, appid: str, ini_path: Path, updates: dict) -> dict:
+        """Caller holds _ini_models_lock."""
+        model = self._load_ini_model(ini_path)
+        lines = list(model["lines"])
+        unknown: list[str] = []
+        changed: list[str] = []
+        for section, values in (updates or {}).items():
+            keys = model["sections"].get(section, {})
+            for key, value in (values or {}).items():
+                if isinstance(value, bool):
+                    value = "true" if value else "false"
+                value = str(value)
+                if key not in keys:
+                    unknown.append(f"[{section}] {key}")
+                    continue
+                if "\n" in value or "\r" in value:
+                    return {"status": "error", "message": f"Value for [{section}] {key} must be a single line."}
+                new_line = optiscaler_ini.line_with_value(lines[keys[key]], value)
+                if new_line != lines[keys[key]]:
+                    lines[keys[key]] = new_line
+                    changed.append(f"[{section}] {key}")
+        if unknown:
+            return {"status": "error", "message": f"Unknown OptiScaler.ini keys: {', '.join(unknown)}"}
+
+        if changed:
+            optiscaler_ini.write_atomic(ini_path, lines)
+            # Only values changed, so the line index still holds for the written file
+            self._ini_models[str(ini_path)] = {
+                "signature": self._stat_signature(os.stat(ini_path)),
+                "lines": lines,
+                "sections": model["sections"],
+            }
+            decky.logger.info(f"[Framegen] Updated {len(changed)} OptiScaler.ini keys for {appid}: {changed}")
+        return {"status": "success", "appid": str(appid), "path": str(ini_path), "changed": changed}
+
+    async def get_game_ini(self, appid: str) -> dict:
+        return await self._run_blocking(self._get_game_ini, str(appid))
+
+    async def update_game_ini(self, appid: str, updates: dict) -> dict:
+        return await self._run_blocking(self._update_game_ini, str(appid), updates)
@@ -1,7 +1,10 @@
 import { callable } from "@decky/api";
 
+// "interactive" runs at full speed; "background" uses idle I/O priority and a bandwidth cap
+export type IoPolicy = "interactive" | "background";
+
 export const runInstallFGMod = callable<
-  [selected_default_variant?: string],
+  [selected_default_variant?: string, io_policy?: IoPolicy],
   {
     status: string;
     message?: string;
@@ -13,12 +16,12 @@ export const runInstallFGMod = callable<
 >("run_install_fgmod");
 
 export const runUninstallFGMod = callable<
-  [],
+  [io_policy?: IoPolicy],
   { status: string; message?: string; output?: string }
 >("run_uninstall_fgmod");
 
 export const setDefaultFsr4Variant = callable<
-  [selected_default_variant?: string],
+  [selected_default_variant?: string, io_policy?: IoPolicy],
   {
     status: string;
     message?: string;
@@ -53,7 +56,7 @@ export const getPathDefaults = callable<
 >("get_path_defaults");
 
 export const runManualPatch = callable<
-  [string, string, string],
+  [string, string, string, IoPolicy?],
   {
     status: string;
     message?: string;
@@ -66,31 +69,35 @@ export const runManualPatch = callable<
 >("manual_patch_directory");
 
 export const runManualUnpatch = callable<
-  [string],
+  [string, IoPolicy?],
   { status: string; message?: string; output?: string }
 >("manual_unpatch_directory");
 
-export const getGameStatus = callable<
-  [appid: string],
-  {
-    status: string;
-    message?: string;
-    appid?: string;
-    name?: string;
-    install_found?: boolean;
-    patched?: boolean;
-    dll_name?: string | null;
-    target_dir?: string | null;
-    patched_at?: string | null;
-    optiscaler_version?: string | null;
-    fsr4_variant?: string | null;
-    fsr4_variant_label?: string | null;
-    fsr4_upscaler_sha256?: string | null;
-  }
->("get_game_status");
+type GameStatusResponse = {
+  status: string;
+  message?: string;
+  appid?: string;
+  name?: string;
+  install_found?: boolean;
+  patched?: boolean;
+  dll_name?: string | null;
+  target_dir?: string | null;
+  patched_at?: string | null;
+  optiscaler_version?: string | null;
+  fsr4_variant?: string | null;
+  fsr4_variant_label?: string | null;
+  fsr4_upscaler_sha256?: string | null;
+};
+
+export const getGameStatus = callable<[appid: string], GameStatusResponse>("get_game_status");
+
+export const getGamesStatus = callable<
+  [appids: string[] | "all"],
+  { status: string; message?: string; games?: Record<string, GameStatusResponse> }
+>("get_games_status");
 
 export const patchGame = callable<
-  [appid: string, dll_name: string, current_launch_options: string, fsr4_variant: string],
+  [appid: string, dll_name: string, current_launch_options: string, fsr4_variant: string, io_policy?: IoPolicy],
   {
     status: string;
     message?: string;
@@ -108,7 +115,7 @@ export const patchGame = callable<
 >("patch_game");
 
 export const unpatchGame = callable<
-  [appid: string],
+  [appid: string, io_policy?: IoPolicy],
   {
     status: string;
     message?: string;
@@ -117,3 +124,21 @@ export const unpatchGame = callable<
     launch_options?: string;
   }
 >("unpatch_game");
+
+export type GameIniKey = { key: string; value: string; comment: string };
+
+export const getGameIni = callable<
+  [appid: string],
+  {
+    status: string;
+    message?: string;
+    appid?: string;
+    path?: string;
+    sections?: { name: string; keys: GameIniKey[] }[];
+  }
+>("get_game_ini");
+
+export const updateGameIni = callable<
+  [appid: string, updates: Record<string, Record<string, string | number | boolean>>],
+  { status: string; message?: string; appid?: string; path?: string; changed?: string[] }
+>("update_game_ini");
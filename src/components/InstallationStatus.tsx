@@ -4,10 +4,11 @@ import { MESSAGES, STYLES } from "../utils/constants";
 interface InstallationStatusProps {
   pathExists: boolean | null;
   installing: boolean;
+  progressText?: string;
   onInstallClick: () => void;
 }
 
-export function InstallationStatus({ pathExists, installing, onInstallClick }: InstallationStatusProps) {
+export function InstallationStatus({ pathExists, installing, progressText, onInstallClick }: InstallationStatusProps) {
   if (pathExists !== false) return null;
 
   return (
@@ -20,7 +21,9 @@ export function InstallationStatus({ pathExists, installing, onInstallClick }: I
       
       <PanelSectionRow>
         <ButtonItem layout="below" onClick={onInstallClick} disabled={installing}>
-          {installing ? MESSAGES.installing : MESSAGES.installButton}
+          {installing
+            ? progressText ? `${MESSAGES.installing} (${progressText})` : MESSAGES.installing
+            : MESSAGES.installButton}
         </ButtonItem>
       </PanelSectionRow>
     </>
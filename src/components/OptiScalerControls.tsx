@@ -2,7 +2,7 @@ import { useState, useEffect } from "react";
 import { DropdownItem, Field, PanelSection, PanelSectionRow, ToggleField } from "@decky/ui";
 import { runInstallFGMod, runUninstallFGMod, setDefaultFsr4Variant } from "../api";
 import { OperationResult } from "./ResultDisplay";
-import { createAutoCleanupTimer } from "../utils";
+import { createAutoCleanupTimer, formatProgress, useOperationProgress } from "../utils";
 import { TIMEOUTS, PROXY_DLL_OPTIONS, DEFAULT_PROXY_DLL, FSR4_VARIANT_OPTIONS, DEFAULT_FSR4_VARIANT } from "../utils/constants";
 import { InstallationStatus } from "./InstallationStatus";
 import { OptiScalerHeader } from "./OptiScalerHeader";
@@ -38,6 +38,7 @@ export function OptiScalerControls({ pathExists, setPathExists, fgmodInfo }: Opt
   const [fsr4Variant, setFsr4Variant] = useState<string>(DEFAULT_FSR4_VARIANT);
   const [fsr4VariantTouched, setFsr4VariantTouched] = useState(false);
   const [switchingVariant, setSwitchingVariant] = useState(false);
+  const installProgress = useOperationProgress("install");
   useEffect(() => {
     if (installResult) {
       return createAutoCleanupTimer(() => setInstallResult(null), TIMEOUTS.resultDisplay);
@@ -119,6 +120,7 @@ export function OptiScalerControls({ pathExists, setPathExists, fgmodInfo }: Opt
       <InstallationStatus 
         pathExists={pathExists}
         installing={installing}
+        progressText={formatProgress(installProgress)}
         onInstallClick={handleInstallClick}
       />
       
@@ -1,8 +1,9 @@
 import { useCallback, useEffect, useMemo, useState } from "react";
 import { ButtonItem, DropdownItem, Field, PanelSectionRow } from "@decky/ui";
-import { toaster } from "@decky/api";
-import { listInstalledGames, getGameStatus, patchGame, unpatchGame } from "../api";
-import { FSR4_VARIANT_OPTIONS } from "../utils/constants";
+import { addEventListener, removeEventListener, toaster } from "@decky/api";
+import { listInstalledGames, getGameStatus, getGamesStatus, patchGame, unpatchGame } from "../api";
+import { EVENTS, FSR4_VARIANT_OPTIONS } from "../utils/constants";
+import { formatProgress, useOperationProgress } from "../utils";
 
 // ─── SteamClient helpers ─────────────────────────────────────────────────────
 
@@ -41,7 +42,7 @@ const setAppLaunchOptions = (appId: number, options: string): void => {
 
 // ─── Types ───────────────────────────────────────────────────────────────────
 
-type GameEntry = { appid: string; name: string; install_found?: boolean };
+type GameEntry = { appid: string; name: string; install_found?: boolean; library_stale?: boolean };
 
 type GameStatus = {
   status: "success" | "error";
@@ -73,19 +74,27 @@ export function SteamGamePatcher({ dllName, fsr4Variant }: SteamGamePatcherProps
   const [gamesLoading, setGamesLoading] = useState(true);
   const [selectedAppId, setSelectedAppId] = useState<string>(() => lastSelectedAppId);
   const [gameStatus, setGameStatus] = useState<GameStatus | null>(null);
+  const [statusByAppId, setStatusByAppId] = useState<Record<string, GameStatus>>({});
   const [statusLoading, setStatusLoading] = useState(false);
   const [busyAction, setBusyAction] = useState<"patch" | "unpatch" | null>(null);
   const [resultMessage, setResultMessage] = useState<string>("");
+  const patchProgress = useOperationProgress("patch");
 
   // ── Data loaders ───────────────────────────────────────────────────────────
 
   const loadGames = useCallback(async () => {
     setGamesLoading(true);
     try {
-      const result = await listInstalledGames();
+      const [result, statuses] = await Promise.all([
+        listInstalledGames(),
+        getGamesStatus("all").catch(() => null),
+      ]);
       if (result.status !== "success") throw new Error(result.message || "Failed to load games.");
       const gameList = result.games as GameEntry[];
       setGames(gameList);
+      if (statuses?.status === "success" && statuses.games) {
+        setStatusByAppId(statuses.games as Record<string, GameStatus>);
+      }
       if (!gameList.length) {
         lastSelectedAppId = "";
         setSelectedAppId("");
@@ -112,8 +121,9 @@ export function SteamGamePatcher({ dllName, fsr4Variant }: SteamGamePatcherProps
     }
     setStatusLoading(true);
     try {
-      const result = await getGameStatus(appid);
-      setGameStatus(result as GameStatus);
+      const result = (await getGameStatus(appid)) as GameStatus;
+      setGameStatus(result);
+      setStatusByAppId((current) => ({ ...current, [appid]: result }));
     } catch (err) {
       setGameStatus({
         status: "error",
@@ -128,13 +138,29 @@ export function SteamGamePatcher({ dllName, fsr4Variant }: SteamGamePatcherProps
     void loadGames();
   }, [loadGames]);
 
+  // The backend watches Steam's library folders and announces installs and removals
+  useEffect(() => {
+    const listener = addEventListener(EVENTS.installedGames, () => {
+      void loadGames();
+    });
+    return () => {
+      removeEventListener(EVENTS.installedGames, listener);
+    };
+  }, [loadGames]);
+
   useEffect(() => {
     if (!selectedAppId) {
       setGameStatus(null);
       return;
     }
+    // Statuses prefetched with the game list make switching games instant
+    const prefetched = statusByAppId[selectedAppId];
+    if (prefetched) {
+      setGameStatus(prefetched);
+      return;
+    }
     void loadStatus(selectedAppId);
-  }, [selectedAppId, loadStatus]);
+  }, [selectedAppId, statusByAppId, loadStatus]);
 
   // ── Derived state ──────────────────────────────────────────────────────────
 
@@ -155,13 +181,14 @@ export function SteamGamePatcher({ dllName, fsr4Variant }: SteamGamePatcherProps
   const canUnpatch = Boolean(selectedGame && gameStatus?.patched && !busyAction);
 
   const patchButtonLabel = useMemo(() => {
-    if (busyAction === "patch") return "Patching...";
+    if (busyAction === "patch")
+      return patchProgress ? `Patching... (${formatProgress(patchProgress)})` : "Patching...";
     if (!selectedGame) return "Patch this game";
     if (!gameStatus?.install_found) return "Install not found";
     if (isPatchedWithDifferentDll) return `Switch to ${dllName}`;
     if (gameStatus?.patched) return `Reinstall (${dllName})`;
     return `Patch with ${dllName}`;
-  }, [busyAction, dllName, gameStatus, isPatchedWithDifferentDll, selectedGame]);
+  }, [busyAction, dllName, gameStatus, isPatchedWithDifferentDll, patchProgress, selectedGame]);
 
   // ── Actions ────────────────────────────────────────────────────────────────
 
@@ -244,7 +271,12 @@ export function SteamGamePatcher({ dllName, fsr4Variant }: SteamGamePatcherProps
           selectedOption={selectedAppId}
           rgOptions={games.map((g) => ({
             data: g.appid,
-            label: g.install_found === false ? `${g.name} (not installed)` : g.name,
+            label:
+              g.install_found === false
+                ? `${g.name} (not installed)`
+                : statusByAppId[g.appid]?.patched
+                  ? `${g.name} (patched)`
+                  : g.name,
           }))}
           onChange={(option) => {
             const next = String(option.data);
@@ -1,11 +1,11 @@
-import { definePlugin } from "@decky/api";
+import { definePlugin, addEventListener, removeEventListener } from "@decky/api";
 import { MdOutlineAutoAwesomeMotion } from "react-icons/md";
 import { useState, useEffect } from "react";
 import { OptiScalerControls } from "./components";
 // import { InstalledGamesSection } from "./components/InstalledGamesSection";
 import { checkFGModPath } from "./api";
 import { safeAsyncOperation } from "./utils";
-import { TIMEOUTS } from "./utils/constants";
+import { EVENTS } from "./utils/constants";
 
 type FgmodInfo = {
   exists: boolean;
@@ -31,9 +31,15 @@ function MainContent() {
       }
     };
     
+    // The backend pushes a new status whenever ~/fgmod changes, so only the initial state is fetched
+    const onBundleStatus = (result: FgmodInfo) => {
+      setFgmodInfo(result);
+      setPathExists(result.exists);
+    };
+    const listener = addEventListener<[FgmodInfo]>(EVENTS.bundleStatus, onBundleStatus);
+
     checkPath(); // Initial check
-    const intervalId = setInterval(checkPath, TIMEOUTS.pathCheck); // Check every 3 seconds
-    return () => clearInterval(intervalId); // Cleanup interval on component unmount
+    return () => removeEventListener(EVENTS.bundleStatus, listener);
   }, []);
 
   return (
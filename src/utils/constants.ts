@@ -82,8 +82,14 @@ export const DEFAULT_FSR4_VARIANT: Fsr4VariantValue = "rdna23-int8";
 
 // Common timeout values
 export const TIMEOUTS = {
-  resultDisplay: 5000,  // 5 seconds
-  pathCheck: 3000       // 3 seconds
+  resultDisplay: 5000   // 5 seconds
+};
+
+// Backend event names (decky.emit)
+export const EVENTS = {
+  progress: "framegen_progress",
+  bundleStatus: "framegen_bundle_status",
+  installedGames: "framegen_installed_games"
 };
 
 // Message strings
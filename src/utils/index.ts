@@ -1,4 +1,15 @@
+import { useEffect, useState } from "react";
+import { addEventListener, removeEventListener } from "@decky/api";
 import { logError } from "../api";
+import { EVENTS } from "./constants";
+
+export interface OperationProgress {
+  id: number;
+  operation: string;
+  stage: string;
+  bytes_done: number;
+  bytes_total: number;
+}
 
 /**
  * Utility for creating a timer that automatically clears after specified timeout
@@ -28,3 +39,44 @@ export const safeAsyncOperation = async <T,>(
     return undefined;
   }
 };
+
+/**
+ * Subscribe to backend progress events for one operation ("install", "patch", "unpatch")
+ * @param operation Operation name to follow
+ * @returns Progress of the most recently started run still in flight, null otherwise
+ */
+export const useOperationProgress = (operation: string): OperationProgress | null => {
+  // Keyed by progress id so overlapping runs neither overwrite nor clear each other
+  const [running, setRunning] = useState<Record<number, OperationProgress>>({});
+
+  useEffect(() => {
+    const listener = addEventListener<[OperationProgress]>(EVENTS.progress, (event) => {
+      if (event.operation !== operation) return;
+      setRunning((previous) => {
+        const next = { ...previous };
+        if (event.stage === "done" || event.stage === "error") {
+          delete next[event.id];
+        } else {
+          next[event.id] = event;
+        }
+        return next;
+      });
+    });
+    return () => {
+      removeEventListener(EVENTS.progress, listener);
+    };
+  }, [operation]);
+
+  const ids = Object.keys(running).map(Number);
+  return ids.length ? running[Math.max(...ids)] : null;
+};
+
+/**
+ * Format progress as "stage NN%" (or just the stage while the total is unknown)
+ */
+export const formatProgress = (progress: OperationProgress | null): string => {
+  if (!progress) return "";
+  if (!progress.bytes_total) return progress.stage;
+  const percent = Math.min(100, Math.floor((progress.bytes_done / progress.bytes_total) * 100));
+  return `${progress.stage} ${percent}%`;
+};